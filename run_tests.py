@@ -12,6 +12,17 @@ from datetime import datetime
 from pathlib import Path
 
 
+def parallel_workers(value):
+    """Parse --parallel: a worker count, or "auto" for all cores but two"""
+    if value == "auto":
+        # Leave two cores for the OS and the xdist controller
+        return max(1, (os.cpu_count() or 1) - 2)
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or 'auto', got {value!r}")
+
+
 def run_command(command, description=""):
     """Run a command and return the result"""
     print(f"\n{'='*60}")
@@ -42,7 +53,7 @@ def main():
     parser.add_argument("--integration", action="store_true", help="Run integration tests only")
     parser.add_argument("--coverage", action="store_true", help="Generate coverage report")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    parser.add_argument("--parallel", "-n", type=int, default=1, help="Number of parallel processes")
+    parser.add_argument("--parallel", "-n", type=parallel_workers, default=1, help="Number of parallel processes, or 'auto'")
     parser.add_argument("--markers", "-m", help="Run tests with specific markers")
     parser.add_argument("--file", "-f", help="Run specific test file")
     parser.add_argument("--quick", action="store_true", help="Run quick tests only (exclude slow tests)")
@@ -60,15 +71,19 @@ def main():
     print(f"📂 Working directory: {os.getcwd()}")
 
     # Base pytest command
-    pytest_cmd = ["python", "-m", "pytest"]
+    # pytest.ini uses a [tool:pytest] header, which pytest does not read, so
+    # auto mode is passed explicitly; async tests then share the session
+    # event_loop fixture from tests/conftest.py
+    pytest_cmd = ["python", "-m", "pytest", "-o", "asyncio_mode=auto"]
 
     # Add verbosity
     if args.verbose:
         pytest_cmd.append("-v")
 
-    # Add parallel processing
+    # Add parallel processing (pytest-xdist); whole files go to one worker
+    # so module-level patches and session fixtures stay per file
     if args.parallel > 1:
-        pytest_cmd.extend(["-n", str(args.parallel)])
+        pytest_cmd.extend(["-n", str(args.parallel), "--dist=loadfile"])
 
     # Add markers
     if args.markers:
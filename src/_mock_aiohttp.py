@@ -0,0 +1,67 @@
+"""
+Sacred Geometry AAR Processor - aiohttp stand-in
+
+Only imported by ``monitoring_integration`` when aiohttp is not installed.
+"""
+
+
+class MockTCPConnector:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def close(self):
+        pass
+
+
+class MockClientSession:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def get(self, *args, **kwargs):
+        class MockResponse:
+            status = 200
+
+            async def json(self, **kwargs):
+                return {}
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+        return MockResponse()
+
+    async def post(self, *args, **kwargs):
+        class MockResponse:
+            status = 200
+
+            async def json(self, **kwargs):
+                return {}
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+        return MockResponse()
+
+    async def close(self):
+        pass
+
+
+class MockClientTimeout:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class MockClientError(Exception):
+    pass
+
+
+class aiohttp:
+    ClientSession = MockClientSession
+    TCPConnector = MockTCPConnector
+    ClientTimeout = MockClientTimeout
+    ClientError = MockClientError
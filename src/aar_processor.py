@@ -24,7 +24,7 @@ from pydantic import BaseModel
 from src.aar_generator import AARGenerator
 from src.compliance_checker import ComplianceChecker
 from src.database_manager import DatabaseManager
-from src.monitoring_integration import MonitoringIntegration
+from src.monitoring_integration import close_monitoring, get_monitoring
 from src.sacred_geometry_engine import SacredGeometryEngine
 
 # Configure structured logging
@@ -117,8 +117,7 @@ async def lifespan(app: FastAPI):
     app.state.aar_generator = AARGenerator(app.state.sacred_geometry)
 
     # Initialize monitoring integration
-    app.state.monitoring = MonitoringIntegration()
-    await app.state.monitoring.connect()
+    app.state.monitoring = await get_monitoring()
 
     # Initialize database manager
     app.state.database = DatabaseManager()
@@ -133,7 +132,7 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     logger.info("🔄 Sacred Geometry AAR Processor shutting down...")
-    await app.state.monitoring.disconnect()
+    await close_monitoring()
     await app.state.database.close()
     logger.info("✅ Sacred Geometry AAR Processor shutdown complete")
 
@@ -280,10 +279,16 @@ async def generate_aar(request: AARRequest, background_tasks: BackgroundTasks):
 
 
 @app.get("/aar/{aar_id}/status")
-async def get_aar_status(aar_id: str):
-    """Get AAR processing status"""
+async def get_aar_status(aar_id: str, compact: bool = False):
+    """Get AAR processing status (``compact=true`` returns only the status)"""
     try:
-        status = await app.state.database.get_aar_status(aar_id)
+        if compact:
+            status_value = await app.state.database.get_aar_status_fast(aar_id)
+            status = (
+                {"aar_id": aar_id, "status": status_value} if status_value else None
+            )
+        else:
+            status = await app.state.database.get_aar_status(aar_id)
         if not status:
             raise HTTPException(status_code=404, detail="AAR not found")
         return status
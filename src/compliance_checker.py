@@ -8,14 +8,56 @@ for Sacred Geometry pattern adherence.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import structlog
 
 from src.sacred_geometry_engine import SacredGeometryEngine
 
 logger = structlog.get_logger(__name__)
 
+# Recommendation text per compliance level, built once at import time
+_RECOMMENDATIONS: Final[Mapping[str, Tuple[str, ...]]] = {
+    "excellent": (
+        "Maintain current Sacred Geometry practices",
+        "Share best practices with other teams",
+        "Consider advanced pattern optimizations",
+    ),
+    "good": (
+        "Continue current practices with minor refinements",
+        "Focus on improving weaker patterns",
+        "Regular compliance monitoring",
+    ),
+    "acceptable": (
+        "Review and strengthen Sacred Geometry implementation",
+        "Increase focus on pattern compliance",
+        "Consider additional training or resources",
+    ),
+    "needs_improvement": (
+        "Immediate review of Sacred Geometry practices required",
+        "Implement structured improvement plan",
+        "Increase monitoring frequency",
+        "Consider expert consultation",
+    ),
+    "critical": (
+        "Emergency intervention required",
+        "Halt non-critical activities until compliance improved",
+        "Implement immediate corrective measures",
+        "Engage Sacred Geometry specialists",
+    ),
+}
+_DEFAULT_RECOMMENDATIONS: Final[Tuple[str, ...]] = ("Contact system administrator",)
+
+# Compliance levels ordered by bucket id (see ComplianceChecker.classify_scores)
+_LEVELS_BY_BUCKET: Final[Tuple[str, ...]] = (
+    "critical",
+    "needs_improvement",
+    "acceptable",
+    "good",
+    "excellent",
+)
+
 
 class ComplianceChecker:
     """Sacred Geometry compliance checker and monitor"""
@@ -47,6 +89,25 @@ class ComplianceChecker:
             level=self._get_compliance_level(compliance_score),
         )
 
+    async def bulk_update_compliance(self, compliance_scores: Sequence[float]):
+        """Apply a batch of compliance scores in order under one timestamp
+
+        Equivalent to calling ``update_compliance`` for each score, but the
+        clock is read and the update logged once for the whole batch.
+        """
+        if not compliance_scores:
+            return
+
+        self.current_compliance = compliance_scores[-1]
+        self.last_check = datetime.now()
+
+        logger.info(
+            "📊 Compliance updated",
+            score=self.current_compliance,
+            level=self._get_compliance_level(self.current_compliance),
+            batch_size=len(compliance_scores),
+        )
+
     async def get_detailed_compliance(self) -> Dict[str, Any]:
         """Get detailed compliance information"""
         compliance_level = self._get_compliance_level(self.current_compliance)
@@ -105,8 +166,11 @@ class ComplianceChecker:
         self, mission_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Validate compliance for a specific mission"""
+        now_iso = datetime.now().isoformat()
         try:
-            validation_result = await self.sacred_geometry.validate_data(mission_data)
+            validation_result = await self.sacred_geometry.validate_data(
+                mission_data, now_iso=now_iso
+            )
             compliance_score = validation_result["overall_compliance"]
 
             # Update current compliance if this is a significant mission
@@ -117,7 +181,7 @@ class ComplianceChecker:
                 "mission_compliance": compliance_score,
                 "compliance_level": self._get_compliance_level(compliance_score),
                 "pattern_results": validation_result["pattern_results"],
-                "validation_timestamp": datetime.now().isoformat(),
+                "validation_timestamp": now_iso,
                 "recommendations": self._generate_mission_recommendations(
                     validation_result
                 ),
@@ -129,7 +193,7 @@ class ComplianceChecker:
                 "mission_compliance": 0.0,
                 "compliance_level": "error",
                 "error": str(e),
-                "validation_timestamp": datetime.now().isoformat(),
+                "validation_timestamp": now_iso,
             }
 
     def _get_compliance_level(self, score: float) -> str:
@@ -139,39 +203,27 @@ class ComplianceChecker:
                 return level
         return "critical"
 
+    def classify_scores(self, scores: Sequence[float]) -> np.ndarray:
+        """Map many compliance scores to bucket ids in one vectorized pass
+
+        Bucket ids index ``_LEVELS_BY_BUCKET`` (0 = critical ... 4 = excellent)
+        and agree with ``_get_compliance_level`` for every score.
+        """
+        edges = np.array(
+            [self.compliance_thresholds[level] for level in _LEVELS_BY_BUCKET[1:]]
+        )
+        return np.searchsorted(edges, np.asarray(scores), side="right").astype(np.int8)
+
+    def get_level_distribution(self, scores: Sequence[float]) -> Dict[str, int]:
+        """Count how many scores fall into each compliance level"""
+        counts = np.bincount(
+            self.classify_scores(scores), minlength=len(_LEVELS_BY_BUCKET)
+        )
+        return {level: int(count) for level, count in zip(_LEVELS_BY_BUCKET, counts)}
+
     def _get_compliance_recommendations(self, level: str) -> List[str]:
         """Get recommendations based on compliance level"""
-        recommendations = {
-            "excellent": [
-                "Maintain current Sacred Geometry practices",
-                "Share best practices with other teams",
-                "Consider advanced pattern optimizations",
-            ],
-            "good": [
-                "Continue current practices with minor refinements",
-                "Focus on improving weaker patterns",
-                "Regular compliance monitoring",
-            ],
-            "acceptable": [
-                "Review and strengthen Sacred Geometry implementation",
-                "Increase focus on pattern compliance",
-                "Consider additional training or resources",
-            ],
-            "needs_improvement": [
-                "Immediate review of Sacred Geometry practices required",
-                "Implement structured improvement plan",
-                "Increase monitoring frequency",
-                "Consider expert consultation",
-            ],
-            "critical": [
-                "Emergency intervention required",
-                "Halt non-critical activities until compliance improved",
-                "Implement immediate corrective measures",
-                "Engage Sacred Geometry specialists",
-            ],
-        }
-
-        return recommendations.get(level, ["Contact system administrator"])
+        return list(_RECOMMENDATIONS.get(level, _DEFAULT_RECOMMENDATIONS))
 
     async def _get_pattern_compliance_status(self) -> Dict[str, str]:
         """Get compliance status for each Sacred Geometry pattern"""
@@ -7,15 +7,40 @@ This module handles persistent storage of AAR data, results, and metadata
 using SQLite with optional PostgreSQL support.
 """
 
+import asyncio
+import copy
 import json
+import queue
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
 
+import numpy as np
 import structlog
+from cachetools import TTLCache
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Maximum number of queued AAR writes committed together by the writer task
+_WRITE_BATCH_SIZE = 64
+
+# Read-only connections serving queries on on-disk databases
+_READER_POOL_SIZE = 4
+
+_INSERT_AAR_SQL = """
+    INSERT INTO aars (
+        aar_id, mission_id, compliance_score,
+        report_content, metadata, generated_at, status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Bucket edges (percent) for compliance score histograms
+_SCORE_BUCKET_EDGES = (0.0, 30.0, 50.0, 70.0, 80.0, 90.0, 100.0)
+_SCORE_PERCENTILES = (50, 90, 99)
+
 
 class DatabaseManager:
     """Database manager for AAR data persistence"""
@@ -23,28 +48,53 @@ class DatabaseManager:
     def __init__(self, db_path: str = "/app/data/aar_database.db"):
         self.db_path = db_path
         self.connection: Optional[sqlite3.Connection] = None
+        # sqlite3 connections are not safe for concurrent use, so every
+        # worker-thread query is serialized through this lock
+        self._lock = threading.Lock()
+        # Completed AARs are immutable, so repeat reads are served from memory
+        self._status_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._report_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        # Write-behind queue drained by a background task that group-commits
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Idle read-only connections; None when reads share ``connection``
+        self._readers: Optional[queue.SimpleQueue] = None
 
     async def initialize(self):
         """Initialize database connection and create tables"""
         logger.info("🗄️ Initializing database", db_path=self.db_path)
 
-        # Ensure directory exists
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        # SQLite URIs (e.g. "file:name?mode=memory&cache=shared") and
+        # ":memory:" databases have no directory to create
+        is_uri = self.db_path.startswith("file:")
+        if not is_uri and self.db_path != ":memory:":
+            # Ensure directory exists
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Connect to database
-        self.connection = sqlite3.connect(self.db_path)
+        self.connection = sqlite3.connect(
+            self.db_path, check_same_thread=False, uri=is_uri
+        )
         self.connection.row_factory = sqlite3.Row  # Enable column access by name
 
         # Create tables
         await self._create_tables()
 
+        if not is_uri and self.db_path != ":memory:":
+            self._open_readers()
+
         logger.info("✅ Database initialized successfully")
 
     async def close(self):
         """Close database connection"""
+        await self._stop_writer()
+        self._close_readers()
         if self.connection:
-            self.connection.close()
-            self.connection = None
+            with self._lock:
+                self.connection.close()
+                self.connection = None
+        self._status_cache.clear()
+        self._report_cache.clear()
         logger.info("🗄️ Database connection closed")
 
     async def is_healthy(self) -> bool:
@@ -53,72 +103,102 @@ class DatabaseManager:
             if not self.connection:
                 return False
 
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1")
-            return cursor.fetchone() is not None
+            def _check_sync() -> bool:
+                cursor = self.connection.cursor()
+                cursor.execute("SELECT 1")
+                return cursor.fetchone() is not None
+
+            return await self._run_sync(_check_sync)
         except Exception as e:
             logger.error("Database health check failed", error=str(e))
             return False
 
     async def store_aar(self, aar_result) -> bool:
-        """Store AAR result in database"""
+        """Store AAR result in database
+
+        The row is queued for the background writer, which commits every
+        queued AAR in one transaction; this returns once that commit lands.
+        """
         try:
             if not self.connection:
                 logger.error("Database connection not available")
                 return False
 
-            cursor = self.connection.cursor()
-
-            # Store main AAR record
-            cursor.execute(
-                """
-                INSERT INTO aars (
-                    aar_id, mission_id, compliance_score,
-                    report_content, metadata, generated_at, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    aar_result.aar_id,
-                    aar_result.mission_id,
-                    aar_result.compliance_score,
-                    json.dumps(aar_result.report_content),
-                    json.dumps(aar_result.metadata),
-                    aar_result.generated_at.isoformat(),
-                    "completed",
-                ),
-            )
-
-            self.connection.commit()
+            self._ensure_writer()
+            done = asyncio.get_running_loop().create_future()
+            await self._write_queue.put((aar_result, done))
+            await done
 
             logger.info("✅ AAR stored successfully", aar_id=aar_result.aar_id)
             return True
 
         except Exception as e:
             logger.error("Failed to store AAR", error=str(e))
-            if self.connection:
-                self.connection.rollback()
             return False
 
+    async def store_aars(self, aar_results: List[Any]) -> List[bool]:
+        """Store several AAR results, committed together
+
+        Every AAR is queued before any is awaited, so the background writer
+        takes them as one batch and commits them in a single transaction
+        (per ``_WRITE_BATCH_SIZE`` rows). Returns one success flag per AAR.
+        """
+        if not self.connection:
+            logger.error("Database connection not available")
+            return [False] * len(aar_results)
+
+        self._ensure_writer()
+        loop = asyncio.get_running_loop()
+        pending = []
+        for aar_result in aar_results:
+            done = loop.create_future()
+            self._write_queue.put_nowait((aar_result, done))
+            pending.append(done)
+
+        outcomes = await asyncio.gather(*pending, return_exceptions=True)
+
+        stored = []
+        for aar_result, outcome in zip(aar_results, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Failed to store AAR",
+                    aar_id=getattr(aar_result, "aar_id", None),
+                    error=str(outcome),
+                )
+                stored.append(False)
+            else:
+                stored.append(True)
+
+        logger.info("✅ AARs stored successfully", count=sum(stored))
+        return stored
+
     async def get_aar_status(self, aar_id: str) -> Optional[Dict[str, Any]]:
         """Get AAR status by ID"""
         try:
             if not self.connection:
                 return None
 
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT aar_id, mission_id, status, compliance_score,
-                       generated_at, created_at
-                FROM aars
-                WHERE aar_id = ?
-            """,
-                (aar_id,),
-            )
+            # Callers get their own copy, so mutating it cannot alter the cache
+            cached = self._status_cache.get(aar_id)
+            if cached is not None:
+                return dict(cached)
 
-            row = cursor.fetchone()
+            def _fetch_sync(connection: sqlite3.Connection) -> Optional[sqlite3.Row]:
+                cursor = connection.cursor()
+                cursor.execute(
+                    """
+                    SELECT aar_id, mission_id, status, compliance_score,
+                           generated_at, created_at
+                    FROM aars
+                    WHERE aar_id = ?
+                """,
+                    (aar_id,),
+                )
+                return cursor.fetchone()
+
+            row = await self._run_read(_fetch_sync)
             if row:
-                return {
+                status = {
                     "aar_id": row["aar_id"],
                     "mission_id": row["mission_id"],
                     "status": row["status"],
@@ -126,8 +206,29 @@ class DatabaseManager:
                     "generated_at": row["generated_at"],
                     "created_at": row["created_at"],
                 }
+                if status["status"] == "completed":
+                    self._status_cache[aar_id] = dict(status)
+                return status
+            return None
+
+        except Exception as e:
+            logger.error("Failed to get AAR status", aar_id=aar_id, error=str(e))
             return None
 
+    async def get_aar_status_fast(self, aar_id: str) -> Optional[str]:
+        """Get only the status column for an AAR (cheap status polling)"""
+        try:
+            if not self.connection:
+                return None
+
+            def _fetch_sync(connection: sqlite3.Connection) -> Optional[sqlite3.Row]:
+                cursor = connection.cursor()
+                cursor.execute("SELECT status FROM aars WHERE aar_id = ?", (aar_id,))
+                return cursor.fetchone()
+
+            row = await self._run_read(_fetch_sync)
+            return row["status"] if row else None
+
         except Exception as e:
             logger.error("Failed to get AAR status", aar_id=aar_id, error=str(e))
             return None
@@ -138,20 +239,27 @@ class DatabaseManager:
             if not self.connection:
                 return None
 
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT aar_id, mission_id, compliance_score,
-                       report_content, metadata, generated_at, status
-                FROM aars
-                WHERE aar_id = ?
-            """,
-                (aar_id,),
-            )
+            # Reports nest dicts, so callers get a deep copy of the cached one
+            cached = self._report_cache.get(aar_id)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+            def _fetch_sync(connection: sqlite3.Connection) -> Optional[sqlite3.Row]:
+                cursor = connection.cursor()
+                cursor.execute(
+                    """
+                    SELECT aar_id, mission_id, compliance_score,
+                           report_content, metadata, generated_at, status
+                    FROM aars
+                    WHERE aar_id = ?
+                """,
+                    (aar_id,),
+                )
+                return cursor.fetchone()
 
-            row = cursor.fetchone()
+            row = await self._run_read(_fetch_sync)
             if row:
-                return {
+                report = {
                     "aar_id": row["aar_id"],
                     "mission_id": row["mission_id"],
                     "compliance_score": row["compliance_score"],
@@ -160,6 +268,9 @@ class DatabaseManager:
                     "generated_at": row["generated_at"],
                     "status": row["status"],
                 }
+                if report["status"] == "completed":
+                    self._report_cache[aar_id] = copy.deepcopy(report)
+                return report
             return None
 
         except Exception as e:
@@ -170,38 +281,70 @@ class DatabaseManager:
         self, limit: int = 100, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """List AAR records with pagination"""
-        try:
-            if not self.connection:
-                return []
+        return [aar async for aar in self.iter_aars(limit=limit, offset=offset)]
 
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT aar_id, mission_id, status, compliance_score,
-                       generated_at, created_at
-                FROM aars
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            """,
-                (limit, offset),
-            )
+    async def iter_aars(
+        self, limit: int = 100, offset: int = 0, batch_size: int = 32
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream AAR records with pagination, fetching ``batch_size`` rows at a time
 
-            rows = cursor.fetchall()
-            return [
-                {
-                    "aar_id": row["aar_id"],
-                    "mission_id": row["mission_id"],
-                    "status": row["status"],
-                    "compliance_score": row["compliance_score"],
-                    "generated_at": row["generated_at"],
-                    "created_at": row["created_at"],
-                }
-                for row in rows
-            ]
+        A failure before the first row is logged and ends the stream empty;
+        once rows have been yielded it is re-raised, so a consumer never
+        mistakes a broken stream for a short one.
+        """
+        streamed = False
+        try:
+            if not self.connection:
+                return
+
+            # The cursor spans several awaits, so a pooled reader is held
+            # for the whole stream rather than borrowed per call
+            reader = await self._acquire_reader()
+            if reader is None:
+                connection, run = self.connection, self._run_sync
+            else:
+                connection, run = reader, asyncio.to_thread
+
+            def _execute_sync() -> sqlite3.Cursor:
+                cursor = connection.cursor()
+                cursor.execute(
+                    """
+                    SELECT aar_id, mission_id, status, compliance_score,
+                           generated_at, created_at
+                    FROM aars
+                    ORDER BY created_at DESC
+                    LIMIT ? OFFSET ?
+                """,
+                    (limit, offset),
+                )
+                return cursor
+
+            try:
+                cursor = await run(_execute_sync)
+                try:
+                    while True:
+                        rows = await run(lambda: cursor.fetchmany(batch_size))
+                        if not rows:
+                            break
+                        streamed = True
+                        for row in rows:
+                            yield {
+                                "aar_id": row["aar_id"],
+                                "mission_id": row["mission_id"],
+                                "status": row["status"],
+                                "compliance_score": row["compliance_score"],
+                                "generated_at": row["generated_at"],
+                                "created_at": row["created_at"],
+                            }
+                finally:
+                    await run(cursor.close)
+            finally:
+                self._release_reader(reader)
 
         except Exception as e:
             logger.error("Failed to list AARs", error=str(e))
-            return []
+            if streamed:
+                raise
 
     async def get_compliance_stats(self) -> Dict[str, Any]:
         """Get Sacred Geometry compliance statistics"""
@@ -209,41 +352,44 @@ class DatabaseManager:
             if not self.connection:
                 return {}
 
-            cursor = self.connection.cursor()
+            def _fetch_sync(connection: sqlite3.Connection):
+                cursor = connection.cursor()
 
-            # Get basic stats
-            cursor.execute(
+                # Get basic stats
+                cursor.execute(
+                    """
+                    SELECT
+                        COUNT(*) as total_aars,
+                        AVG(compliance_score) as avg_compliance,
+                        MIN(compliance_score) as min_compliance,
+                        MAX(compliance_score) as max_compliance
+                    FROM aars INDEXED BY idx_completed_score
+                    WHERE status = 'completed'
                 """
-                SELECT
-                    COUNT(*) as total_aars,
-                    AVG(compliance_score) as avg_compliance,
-                    MIN(compliance_score) as min_compliance,
-                    MAX(compliance_score) as max_compliance
-                FROM aars
-                WHERE status = 'completed'
-            """
-            )
+                )
 
-            stats_row = cursor.fetchone()
+                stats_row = cursor.fetchone()
 
-            # Get compliance distribution
-            cursor.execute(
+                # Get compliance distribution
+                cursor.execute(
+                    """
+                    SELECT
+                        CASE
+                            WHEN compliance_score >= 90 THEN 'excellent'
+                            WHEN compliance_score >= 80 THEN 'good'
+                            WHEN compliance_score >= 70 THEN 'acceptable'
+                            ELSE 'needs_improvement'
+                        END as compliance_level,
+                        COUNT(*) as count
+                    FROM aars INDEXED BY idx_completed_score
+                    WHERE status = 'completed'
+                    GROUP BY compliance_level
                 """
-                SELECT
-                    CASE
-                        WHEN compliance_score >= 90 THEN 'excellent'
-                        WHEN compliance_score >= 80 THEN 'good'
-                        WHEN compliance_score >= 70 THEN 'acceptable'
-                        ELSE 'needs_improvement'
-                    END as compliance_level,
-                    COUNT(*) as count
-                FROM aars
-                WHERE status = 'completed'
-                GROUP BY compliance_level
-            """
-            )
+                )
 
-            distribution_rows = cursor.fetchall()
+                return stats_row, cursor.fetchall()
+
+            stats_row, distribution_rows = await self._run_read(_fetch_sync)
 
             return {
                 "total_aars": stats_row["total_aars"] if stats_row else 0,
@@ -259,6 +405,223 @@ class DatabaseManager:
             logger.error("Failed to get compliance stats", error=str(e))
             return {}
 
+    def _invalidate_cached(self, aar_id: str):
+        """Drop any cached status/report for an AAR after it is written"""
+        self._status_cache.pop(aar_id, None)
+        self._report_cache.pop(aar_id, None)
+
+    def _ensure_writer(self):
+        """Start the write-behind task on the running loop if it is not alive"""
+        if self._writer_task is None or self._writer_task.done():
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _stop_writer(self):
+        """Flush queued writes and stop the write-behind task"""
+        if self._writer_task is None:
+            return
+        if not self._writer_task.done():
+            await self._write_queue.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+        self._write_queue = None
+
+    async def _writer_loop(self):
+        """Drain queued AAR writes, committing whatever has accumulated at once"""
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _WRITE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                errors = await self._run_sync(lambda: self._insert_aars_sync(batch))
+            except Exception as e:
+                errors = [e] * len(batch)
+
+            for (aar_result, done), error in zip(batch, errors):
+                if error is None:
+                    self._invalidate_cached(aar_result.aar_id)
+                if not done.done():
+                    if error is None:
+                        done.set_result(True)
+                    else:
+                        done.set_exception(error)
+                queue.task_done()
+
+    def _insert_aars_sync(self, batch) -> List[Optional[Exception]]:
+        """Insert a batch of AARs in one transaction, isolating bad rows on error"""
+        errors: List[Optional[Exception]] = []
+        rows = []
+        for aar_result, _ in batch:
+            try:
+                rows.append(
+                    (
+                        aar_result.aar_id,
+                        aar_result.mission_id,
+                        aar_result.compliance_score,
+                        json.dumps(aar_result.report_content),
+                        json.dumps(aar_result.metadata),
+                        aar_result.generated_at.isoformat(),
+                        "completed",
+                    )
+                )
+                errors.append(None)
+            except Exception as e:
+                rows.append(None)
+                errors.append(e)
+
+        try:
+            self.connection.executemany(
+                _INSERT_AAR_SQL, [row for row in rows if row is not None]
+            )
+            self.connection.commit()
+            return errors
+        except Exception:
+            self.connection.rollback()
+
+        # One row broke the batch; retry individually so only it fails
+        for index, row in enumerate(rows):
+            if row is None:
+                continue
+            try:
+                self.connection.execute(_INSERT_AAR_SQL, row)
+                self.connection.commit()
+            except Exception as e:
+                self.connection.rollback()
+                errors[index] = e
+        return errors
+
+    async def _run_sync(self, func: Callable[[], T]) -> T:
+        """Run a blocking sqlite3 call in a worker thread under the connection lock"""
+
+        def _locked() -> T:
+            with self._lock:
+                return func()
+
+        return await asyncio.to_thread(_locked)
+
+    async def _run_read(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a blocking query on a pooled reader, or on the locked connection
+
+        Readers only see committed rows, which is every row a finished
+        ``store_aar`` has written.
+        """
+        if self._readers is None:
+            return await self._run_sync(lambda: func(self.connection))
+
+        readers = self._readers
+
+        def _borrowed() -> T:
+            reader = readers.get()
+            try:
+                return func(reader)
+            finally:
+                self._release_reader(reader)
+
+        return await asyncio.to_thread(_borrowed)
+
+    async def _acquire_reader(self) -> Optional[sqlite3.Connection]:
+        """Take a pooled reader for exclusive use, or None without a pool"""
+        if self._readers is None:
+            return None
+        take = asyncio.ensure_future(asyncio.to_thread(self._readers.get))
+        try:
+            return await asyncio.shield(take)
+        except asyncio.CancelledError:
+            # The worker thread still takes a reader; return it once it has
+            take.add_done_callback(self._release_taken_reader)
+            raise
+
+    def _release_taken_reader(self, take: "asyncio.Future[sqlite3.Connection]"):
+        """Done-callback returning a reader whose acquiring task was cancelled"""
+        if not take.cancelled() and take.exception() is None:
+            self._release_reader(take.result())
+
+    def _release_reader(self, reader: Optional[sqlite3.Connection]):
+        """Return a reader from ``_acquire_reader`` (closing it if the pool is gone)"""
+        if reader is None:
+            return
+        if self._readers is None:
+            reader.close()
+        else:
+            self._readers.put(reader)
+
+    def _open_readers(self):
+        """Open the read-only connection pool for an on-disk database
+
+        WAL lets the readers run while the writer commits. Memory databases
+        are private to one connection (and shared-cache ones lock whole
+        tables), so they keep serving reads from ``connection``.
+        """
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        readers: queue.SimpleQueue = queue.SimpleQueue()
+        for _ in range(_READER_POOL_SIZE):
+            reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            reader.row_factory = sqlite3.Row
+            readers.put(reader)
+        self._readers = readers
+
+    def _close_readers(self):
+        """Close every idle pooled reader; borrowed ones close on release"""
+        readers, self._readers = self._readers, None
+        while readers is not None and not readers.empty():
+            readers.get_nowait().close()
+
+    async def get_score_array(self) -> np.ndarray:
+        """Get all completed AAR compliance scores as a flat float32 array"""
+        try:
+            if not self.connection:
+                return np.empty(0, dtype=np.float32)
+
+            def _fetch_sync(connection: sqlite3.Connection) -> List[sqlite3.Row]:
+                cursor = connection.cursor()
+                cursor.execute(
+                    """
+                    SELECT compliance_score
+                    FROM aars INDEXED BY idx_completed_score
+                    WHERE status = 'completed'
+                """
+                )
+                return cursor.fetchall()
+
+            rows = await self._run_read(_fetch_sync)
+            return np.fromiter((row[0] for row in rows), dtype=np.float32)
+
+        except Exception as e:
+            logger.error("Failed to get compliance score array", error=str(e))
+            return np.empty(0, dtype=np.float32)
+
+    async def get_score_distribution(self) -> Dict[str, Any]:
+        """Get percentile and histogram breakdown of completed compliance scores"""
+        scores = await self.get_score_array()
+        if scores.size == 0:
+            return {
+                "total_aars": 0,
+                "percentiles": {f"p{p}": None for p in _SCORE_PERCENTILES},
+                "histogram": {"bin_edges": list(_SCORE_BUCKET_EDGES), "counts": []},
+            }
+
+        percentiles = np.percentile(scores, _SCORE_PERCENTILES)
+        counts, edges = np.histogram(scores, bins=_SCORE_BUCKET_EDGES)
+
+        return {
+            "total_aars": int(scores.size),
+            "percentiles": {
+                f"p{p}": float(value)
+                for p, value in zip(_SCORE_PERCENTILES, percentiles)
+            },
+            "histogram": {
+                "bin_edges": edges.tolist(),
+                "counts": counts.tolist(),
+            },
+        }
+
     async def _create_tables(self):
         """Create database tables"""
         cursor = self.connection.cursor()
@@ -286,6 +649,14 @@ class DatabaseManager:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_mission_id ON aars(mission_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_status ON aars(status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON aars(created_at)")
+        # Partial covering index so compliance stats only read completed scores
+        # (status is included so SQLite never has to visit the table rows)
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_completed_score
+            ON aars(compliance_score, status) WHERE status = 'completed'
+        """
+        )
 
         # Create Sacred Geometry patterns table for detailed analysis
         cursor.execute(
@@ -293,6 +664,7 @@ class DatabaseManager:
             CREATE TABLE IF NOT EXISTS sg_patterns (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 aar_id TEXT NOT NULL,
+                mission_id TEXT,
                 pattern_name TEXT NOT NULL,
                 pattern_score REAL NOT NULL,
                 pattern_details TEXT,
@@ -302,48 +674,95 @@ class DatabaseManager:
         """
         )
 
+        # Databases created before mission_id was denormalized onto sg_patterns
+        # get the column added and backfilled from aars
+        cursor.execute("PRAGMA table_info(sg_patterns)")
+        if "mission_id" not in {row["name"] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE sg_patterns ADD COLUMN mission_id TEXT")
+            cursor.execute(
+                """
+                UPDATE sg_patterns
+                SET mission_id = (
+                    SELECT mission_id FROM aars WHERE aars.aar_id = sg_patterns.aar_id
+                )
+            """
+            )
+
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_sg_aar_id ON sg_patterns(aar_id)"
         )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_sg_pattern ON sg_patterns(pattern_name)"
         )
+        # Covering index for get_pattern_trends (no table or aars lookups)
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_sg_pattern_time ON sg_patterns(
+                pattern_name, created_at DESC, aar_id, mission_id, pattern_score
+            )
+        """
+        )
+
+        # Refresh planner statistics so the indexes above are picked up
+        cursor.execute("ANALYZE")
 
         self.connection.commit()
         logger.debug("Database tables created successfully")
 
     async def store_sg_pattern_details(
-        self, aar_id: str, pattern_results: Dict[str, Any]
+        self,
+        aar_id: str,
+        pattern_results: Dict[str, Any],
+        mission_id: Optional[str] = None,
     ):
-        """Store detailed Sacred Geometry pattern analysis"""
+        """Store detailed Sacred Geometry pattern analysis
+
+        ``mission_id`` is denormalized onto each row; when omitted it is looked
+        up once from the stored AAR.
+        """
         try:
             if not self.connection:
                 return False
 
-            cursor = self.connection.cursor()
-
-            for pattern_name, pattern_data in pattern_results.items():
-                cursor.execute(
-                    """
-                    INSERT INTO sg_patterns (
-                        aar_id, pattern_name, pattern_score, pattern_details
-                    ) VALUES (?, ?, ?, ?)
-                """,
-                    (
-                        aar_id,
-                        pattern_name,
-                        pattern_data.get("score", 0.0),
-                        json.dumps(pattern_data),
-                    ),
-                )
-
-            self.connection.commit()
+            def _store_sync():
+                try:
+                    cursor = self.connection.cursor()
+
+                    row_mission_id = mission_id
+                    if row_mission_id is None:
+                        cursor.execute(
+                            "SELECT mission_id FROM aars WHERE aar_id = ?", (aar_id,)
+                        )
+                        aar_row = cursor.fetchone()
+                        row_mission_id = aar_row["mission_id"] if aar_row else None
+
+                    for pattern_name, pattern_data in pattern_results.items():
+                        cursor.execute(
+                            """
+                            INSERT INTO sg_patterns (
+                                aar_id, mission_id, pattern_name,
+                                pattern_score, pattern_details
+                            ) VALUES (?, ?, ?, ?, ?)
+                        """,
+                            (
+                                aar_id,
+                                row_mission_id,
+                                pattern_name,
+                                pattern_data.get("score", 0.0),
+                                json.dumps(pattern_data),
+                            ),
+                        )
+
+                    self.connection.commit()
+                except Exception:
+                    self.connection.rollback()
+                    raise
+
+            await self._run_sync(_store_sync)
             return True
 
         except Exception as e:
             logger.error("Failed to store SG pattern details", error=str(e))
-            if self.connection:
-                self.connection.rollback()
             return False
 
     async def get_pattern_trends(
@@ -354,24 +773,21 @@ class DatabaseManager:
             if not self.connection:
                 return []
 
-            cursor = self.connection.cursor()
-            cursor.execute(
-                """
-                SELECT
-                    sp.aar_id,
-                    a.mission_id,
-                    sp.pattern_score,
-                    sp.created_at
-                FROM sg_patterns sp
-                JOIN aars a ON sp.aar_id = a.aar_id
-                WHERE sp.pattern_name = ?
-                ORDER BY sp.created_at DESC
-                LIMIT ?
-            """,
-                (pattern_name, limit),
-            )
+            def _fetch_sync(connection: sqlite3.Connection) -> List[sqlite3.Row]:
+                cursor = connection.cursor()
+                cursor.execute(
+                    """
+                    SELECT aar_id, mission_id, pattern_score, created_at
+                    FROM sg_patterns
+                    WHERE pattern_name = ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """,
+                    (pattern_name, limit),
+                )
+                return cursor.fetchall()
 
-            rows = cursor.fetchall()
+            rows = await self._run_read(_fetch_sync)
             return [
                 {
                     "aar_id": row["aar_id"],
@@ -2,86 +2,246 @@
 Sacred Geometry AAR Processor - Monitoring Integration
 """
 
-import json
-from datetime import datetime
-from typing import Any, Dict, Optional
+import asyncio
+import gzip
+import os
+import random
+import socket
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+import orjson
+import structlog
+from prometheus_client import Counter, Histogram
 
 try:
     import aiohttp
-    import structlog
-
-    logger = structlog.get_logger(__name__)
 except ImportError:
-    import logging
-
-    logger = logging.getLogger(__name__)
-    logging.basicConfig(level=logging.INFO)
-
     # Mock aiohttp for environments without it
-    class MockClientSession:
-        async def get(self, *args, **kwargs):
-            class MockResponse:
-                status = 200
-
-                async def json(self):
-                    return {}
-
-                async def __aenter__(self):
-                    return self
-
-                async def __aexit__(self, *args):
-                    pass
-
-            return MockResponse()
-
-        async def post(self, *args, **kwargs):
-            class MockResponse:
-                status = 200
-
-                async def __aenter__(self):
-                    return self
-
-                async def __aexit__(self, *args):
-                    pass
-
-            return MockResponse()
+    from src._mock_aiohttp import aiohttp
 
-        async def close(self):
-            pass
-
-    class aiohttp:
-        ClientSession = MockClientSession
+try:
+    # c-ares resolver; without it aiohttp resolves through getaddrinfo threads
+    import aiodns  # noqa: F401
+    from aiohttp.resolver import AsyncResolver
+except ImportError:
+    AsyncResolver = None
+
+logger = structlog.get_logger(__name__)
+
+# Elasticsearch _bulk batching: flush after this many documents or this many
+# seconds after the first queued document, whichever comes first
+_BULK_MAX_DOCS = 500
+_BULK_FLUSH_INTERVAL = 0.2
+# Upper bound on how long disconnect() waits for queued documents to flush
+_BULK_DRAIN_TIMEOUT = 5.0
+# Documents allowed to wait for the flusher before new ones are shed
+_BULK_QUEUE_MAXSIZE = 2 * _BULK_MAX_DOCS
+
+# _bulk bodies at least this large are gzip-compressed; smaller ones are not
+# worth the CPU. Level 1 already shrinks repetitive metric JSON several-fold
+_BULK_GZIP_MIN_BYTES = 1024
+_BULK_GZIP_LEVEL = 1
+# Per-request deadline for _bulk POSTs so a stalled backend cannot pin sockets
+_BULK_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=2.0, connect=0.5)
+# A failed _bulk POST is retried once after up to this much random delay
+_BULK_RETRY_JITTER = 0.1
+# Consecutive failed _bulk POSTs that open the circuit, and how long it stays
+# open; while open, documents are dropped instead of hitting Elasticsearch
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_OPEN_SECONDS = 30.0
+
+# Alert severities in increasing order; alerts below AAR_ALERT_MIN are not
+# persisted, and unknown severities are always sent
+_SEV_RANK = {"debug": 0, "info": 1, "warning": 2, "error": 3, "critical": 4}
+
+# Upper bound on the startup connection tests so a hung backend cannot stall
+# service bring-up
+_CONNECT_TIMEOUT = 2.0
+
+# How long a backend health result is reused before probing again
+_HEALTH_CACHE_TTL = 5.0
+# Deadline for the Elasticsearch cluster health probe
+_HEALTH_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=1.5)
+
+# Errors a request to a backend can raise; aiohttp raises RuntimeError for a
+# request on a session that disconnect() already closed
+_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError)
+
+metrics_dropped_total = Counter(
+    "aar_monitoring_metrics_dropped_total",
+    "Monitoring documents dropped because Elasticsearch was backed up, "
+    "unavailable or rejected them",
+)
+aar_compliance_score = Histogram(
+    "aar_compliance_score_percentage",
+    "Sacred Geometry compliance score of each processed AAR",
+    buckets=(50.0, 70.0, 80.0, 90.0, 95.0, 99.0, 100.0),
+)
+health_check_cache_hits_total = Counter(
+    "aar_monitoring_health_check_cache_hits_total",
+    "Backend health checks answered from the TTL cache",
+)
+health_check_cache_misses_total = Counter(
+    "aar_monitoring_health_check_cache_misses_total",
+    "Backend health checks that had to probe the backend",
+)
+
+
+# (epoch second, ISO string) of the last formatted timestamp
+_timestamp_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """UTC ISO-8601 timestamp at one-second resolution, formatted once per second"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return _timestamp_cache[1]
+
+
+def _health_or_error(result: Any) -> Dict[str, Any]:
+    """Turn an exception returned by ``asyncio.gather`` into an unhealthy status"""
+    if isinstance(result, BaseException):
+        return {"status": "unhealthy", "error": repr(result)}
+    return result
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """JSON-encode with orjson (aiohttp's json_serialize expects a str)"""
+    return orjson.dumps(obj).decode()
+
+
+@dataclass(slots=True)
+class AARMetric:
+    """Per-AAR metric document; orjson serializes slotted dataclasses natively"""
+
+    aar_id: str
+    compliance_score: float
+    processing_duration: float
+    timestamp: str
 
 
 class MonitoringIntegration:
     """Integration with monitoring and observability systems"""
 
+    __slots__ = (
+        "prometheus_url",
+        "grafana_url",
+        "elasticsearch_url",
+        "_es_bulk_url",
+        "_es_health_url",
+        "_es_health_probe_url",
+        "_alert_url",
+        "_prom_query_url",
+        "_prom_health_url",
+        "_prom_up_params",
+        "_json_headers",
+        "_ndjson_headers",
+        "_ndjson_gzip_headers",
+        "_alert_min_rank",
+        "connected",
+        "session",
+        "_bulk_queue",
+        "_bulk_task",
+        "_breaker",
+        "_health_cache",
+        "_health_locks",
+    )
+
     def __init__(self):
         self.prometheus_url = "http://prometheus:9090"
         self.grafana_url = "http://grafana:3000"
         self.elasticsearch_url = "http://elasticsearch:9200"
+        # Request targets and headers never change, so build them once
+        self._es_bulk_url = f"{self.elasticsearch_url}/_bulk"
+        self._es_health_url = f"{self.elasticsearch_url}/_cluster/health"
+        # Let Elasticsearch trim the health body to the fields we report
+        self._es_health_probe_url = (
+            f"{self._es_health_url}"
+            "?filter_path=status,cluster_name,number_of_nodes&timeout=1s"
+        )
+        self._alert_url = f"{self.elasticsearch_url}/alerts/_doc"
+        self._prom_query_url = f"{self.prometheus_url}/api/v1/query"
+        self._prom_health_url = f"{self.prometheus_url}/-/healthy"
+        self._prom_up_params = {"query": "up"}
+        self._json_headers = {"Content-Type": "application/json"}
+        self._ndjson_headers = {"Content-Type": "application/x-ndjson"}
+        self._ndjson_gzip_headers = {
+            "Content-Type": "application/x-ndjson",
+            "Content-Encoding": "gzip",
+        }
+        self._alert_min_rank = _SEV_RANK.get(
+            os.getenv("AAR_ALERT_MIN", "warning").lower(), _SEV_RANK["warning"]
+        )
         self.connected = False
         self.session: Optional[aiohttp.ClientSession] = None
+        # Documents waiting for the background _bulk flusher
+        self._bulk_queue: Optional[asyncio.Queue] = None
+        self._bulk_task: Optional[asyncio.Task] = None
+        # Circuit breaker for the _bulk endpoint: consecutive failures and the
+        # monotonic time until which sends are short-circuited
+        self._breaker = {"fails": 0, "open_until": 0.0}
+        # Short-lived health results; the per-key lock coalesces concurrent
+        # probes into a single backend request
+        self._health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._health_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     async def connect(self):
         """Connect to monitoring systems"""
         try:
-            self.session = aiohttp.ClientSession()
-
-            # Test connections
-            await self._test_prometheus_connection()
-            await self._test_elasticsearch_connection()
+            # One pooled keep-alive connector shared by every request so repeat
+            # metric/alert/health calls reuse connections instead of reconnecting
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                keepalive_timeout=75,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                # Service names resolve to IPv4 inside the compose network;
+                # skipping AAAA lookups halves resolver round trips
+                family=socket.AF_INET,
+                resolver=AsyncResolver() if AsyncResolver else None,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Connection": "keep-alive"},
+                json_serialize=_orjson_dumps,
+            )
+
+            # Test both backends concurrently within one startup deadline; a
+            # failure in either cancels the other and fails the connect
+            async with asyncio.timeout(_CONNECT_TIMEOUT), asyncio.TaskGroup() as tg:
+                tg.create_task(self._test_prometheus_connection())
+                tg.create_task(self._test_elasticsearch_connection())
 
             self.connected = True
             logger.info("Connected to monitoring systems")
 
+        except TimeoutError:
+            logger.error(
+                "Monitoring systems did not answer in time", timeout=_CONNECT_TIMEOUT
+            )
+            self.connected = False
+        except ExceptionGroup as eg:
+            logger.error(
+                "Failed to connect to monitoring systems", error=str(eg.exceptions[0])
+            )
+            self.connected = False
         except Exception as e:
-            logger.error(f"Failed to connect to monitoring systems: {str(e)}")
+            logger.error("Failed to connect to monitoring systems", error=str(e))
             self.connected = False
 
     async def disconnect(self):
         """Disconnect from monitoring systems"""
+        await self._stop_bulk_flusher()
         if self.session:
+            # The session owns its connector, so this also closes pooled sockets
             await self.session.close()
         self.connected = False
         logger.info("Disconnected from monitoring systems")
@@ -90,92 +250,280 @@ class MonitoringIntegration:
         """Check if connected to monitoring systems"""
         return self.connected
 
+    async def flush(self):
+        """Wait until every queued Elasticsearch document has been sent"""
+        if self._bulk_queue is not None and self._bulk_task is not None:
+            await self._bulk_queue.join()
+
     async def send_aar_metrics(
         self, aar_id: str, compliance_score: float, processing_duration: float
     ):
-        """Send AAR metrics to monitoring systems"""
-        try:
-            metrics = {
-                "aar_id": aar_id,
-                "compliance_score": compliance_score,
-                "processing_duration": processing_duration,
-                "timestamp": datetime.now().isoformat(),
-            }
+        """Send AAR metrics to monitoring systems
 
-            await self._send_to_elasticsearch(metrics)
-            await self._send_to_prometheus(metrics)
+        Both sinks are local (a bounded queue and the Prometheus registry), so
+        there is no network error to handle here; delivery failures are
+        handled by the _bulk flusher.
+        """
+        metrics = AARMetric(aar_id, compliance_score, processing_duration, _now_iso())
 
-            logger.info(f"Sent metrics for AAR {aar_id}")
+        await self._send_to_elasticsearch(metrics)
+        await self._send_to_prometheus(metrics)
 
-        except Exception as e:
-            logger.error(f"Failed to send metrics: {str(e)}")
+        logger.info("Sent AAR metrics", aar_id=aar_id)
 
     async def get_system_health(self) -> Dict[str, Any]:
         """Get overall system health metrics"""
-        try:
-            health_data = {
-                "prometheus": await self._check_prometheus_health(),
-                "elasticsearch": await self._check_elasticsearch_health(),
-                "timestamp": datetime.now().isoformat(),
-            }
-            return health_data
-        except Exception as e:
-            logger.error(f"Failed to get system health: {str(e)}")
-            return {"error": str(e)}
+        # Probe both backends concurrently so they share one round trip; an
+        # unexpected error in either probe is reported as that backend's status
+        prometheus, elasticsearch = await asyncio.gather(
+            self._cached_health("prometheus", self._check_prometheus_health),
+            self._cached_health("elasticsearch", self._check_elasticsearch_health),
+            return_exceptions=True,
+        )
+        return {
+            "prometheus": _health_or_error(prometheus),
+            "elasticsearch": _health_or_error(elasticsearch),
+            "timestamp": _now_iso(),
+        }
+
+    async def _cached_health(
+        self, key: str, check: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Return a recent health result for ``key`` or run ``check`` once"""
+        cached = self._health_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _HEALTH_CACHE_TTL:
+            health_check_cache_hits_total.inc()
+            return cached[1]
+
+        async with self._health_locks[key]:
+            # Another caller may have refreshed it while we waited
+            cached = self._health_cache.get(key)
+            if cached and time.monotonic() - cached[0] < _HEALTH_CACHE_TTL:
+                health_check_cache_hits_total.inc()
+                return cached[1]
+
+            health_check_cache_misses_total.inc()
+            result = await check()
+            self._health_cache[key] = (time.monotonic(), result)
+            return result
 
     async def _test_prometheus_connection(self):
         """Test connection to Prometheus"""
-        url = f"{self.prometheus_url}/api/v1/query"
-        params = {"query": "up"}
-
-        async with self.session.get(url, params=params) as response:
+        async with self.session.get(
+            self._prom_query_url, params=self._prom_up_params
+        ) as response:
             if response.status != 200:
                 logger.warning(
-                    f"Prometheus connection test returned: {response.status}"
+                    "Prometheus connection test failed", status=response.status
                 )
 
     async def _test_elasticsearch_connection(self):
         """Test connection to Elasticsearch"""
-        url = f"{self.elasticsearch_url}/_cluster/health"
-
-        async with self.session.get(url) as response:
+        async with self.session.get(self._es_health_url) as response:
             if response.status != 200:
                 logger.warning(
-                    f"Elasticsearch connection test returned: {response.status}"
+                    "Elasticsearch connection test failed", status=response.status
                 )
 
-    async def _send_to_elasticsearch(self, data: Dict[str, Any]):
-        """Send data to Elasticsearch"""
-        url = f"{self.elasticsearch_url}/aar-metrics/_doc"
-        headers = {"Content-Type": "application/json"}
+    async def _send_to_elasticsearch(
+        self, data: Union[Dict[str, Any], AARMetric], index: str = "aar-metrics"
+    ):
+        """Queue data for the next Elasticsearch _bulk request
+
+        Never waits on the network: when the queue is full (Elasticsearch is
+        slow) or the circuit breaker is open (Elasticsearch is failing) the
+        document is dropped and counted instead.
+        """
+        if self._breaker_open():
+            metrics_dropped_total.inc()
+            return
 
-        async with self.session.post(url, json=data, headers=headers) as response:
+        self._ensure_bulk_flusher()
+        try:
+            self._bulk_queue.put_nowait((index, data))
+        except asyncio.QueueFull:
+            metrics_dropped_total.inc()
+            logger.warning("Elasticsearch queue full, dropped document", index=index)
+
+    def _ensure_bulk_flusher(self):
+        """Start the _bulk flusher on the running loop if it is not alive"""
+        if self._bulk_task is None or self._bulk_task.done():
+            self._bulk_queue = asyncio.Queue(maxsize=_BULK_QUEUE_MAXSIZE)
+            self._bulk_task = asyncio.create_task(self._bulk_flusher())
+
+    async def _stop_bulk_flusher(self):
+        """Flush queued documents (bounded) and stop the _bulk flusher"""
+        if self._bulk_task is None:
+            return
+        if not self._bulk_task.done():
+            try:
+                await asyncio.wait_for(
+                    self._bulk_queue.join(), timeout=_BULK_DRAIN_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Dropping unsent Elasticsearch documents on disconnect",
+                    pending=self._bulk_queue.qsize(),
+                )
+            self._bulk_task.cancel()
+            try:
+                await self._bulk_task
+            except asyncio.CancelledError:
+                pass
+        self._bulk_task = None
+        self._bulk_queue = None
+
+    async def _bulk_flusher(self):
+        """Group queued documents into Elasticsearch _bulk requests"""
+        queue = self._bulk_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _BULK_FLUSH_INTERVAL
+            while len(batch) < _BULK_MAX_DOCS:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                if self._breaker_open():
+                    metrics_dropped_total.inc(len(batch))
+                else:
+                    await self._send_bulk(batch)
+            except Exception as e:
+                logger.error(
+                    "Failed to send bulk request to Elasticsearch", error=str(e)
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _breaker_open(self) -> bool:
+        """Whether _bulk sends are currently short-circuited"""
+        return time.monotonic() < self._breaker["open_until"]
+
+    async def _send_bulk(self, batch):
+        """Send a batch with one jittered retry, feeding the circuit breaker
+
+        Only server errors (5xx), timeouts and connection errors count as
+        failures; a 4xx or an unreadable response means Elasticsearch is up,
+        so the batch is not retried but is still counted as dropped.
+        """
+        lines = []
+        for index, document in batch:
+            lines.append(orjson.dumps({"index": {"_index": index}}))
+            lines.append(orjson.dumps(document))
+        body = b"\n".join(lines) + b"\n"
+        headers = self._ndjson_headers
+        if len(body) >= _BULK_GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=_BULK_GZIP_LEVEL)
+            headers = self._ndjson_gzip_headers
+
+        for attempt in range(2):
+            if attempt:
+                await asyncio.sleep(random.uniform(0, _BULK_RETRY_JITTER))
+            try:
+                status = await self._post_bulk(body, headers, len(batch))
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                error = repr(e)
+            except orjson.JSONDecodeError as e:
+                # Retrying could index the batch twice, and which documents
+                # landed is unknown, so count the whole batch as lost
+                self._breaker["fails"] = 0
+                metrics_dropped_total.inc(len(batch))
+                logger.error(
+                    "Unreadable Elasticsearch bulk response",
+                    error=repr(e),
+                    documents=len(batch),
+                )
+                return
+            else:
+                if status < 500:
+                    self._breaker["fails"] = 0
+                    if status not in (200, 201):
+                        metrics_dropped_total.inc(len(batch))
+                    return
+                error = f"HTTP {status}"
+
+        self._breaker["fails"] += 1
+        metrics_dropped_total.inc(len(batch))
+        logger.error(
+            "Failed to send bulk request to Elasticsearch",
+            error=error,
+            documents=len(batch),
+        )
+        if self._breaker["fails"] >= _BREAKER_FAILURE_THRESHOLD:
+            self._breaker["open_until"] = time.monotonic() + _BREAKER_OPEN_SECONDS
+            logger.warning(
+                "Elasticsearch circuit opened",
+                failures=self._breaker["fails"],
+                open_seconds=_BREAKER_OPEN_SECONDS,
+            )
+
+    async def _post_bulk(self, body: bytes, headers: Dict[str, str], count: int) -> int:
+        """POST one NDJSON _bulk request, report per-document failures and
+        return the HTTP status"""
+        async with self.session.post(
+            url=self._es_bulk_url,
+            data=body,
+            headers=headers,
+            timeout=_BULK_REQUEST_TIMEOUT,
+        ) as response:
             if response.status not in [200, 201]:
-                logger.error(f"Failed to send to Elasticsearch: {response.status}")
+                logger.error("Failed to send to Elasticsearch", status=response.status)
+                return response.status
+
+            result = await response.json(loads=orjson.loads)
+            if result.get("errors"):
+                failed = [
+                    item
+                    for item in result.get("items", [])
+                    if next(iter(item.values()), {}).get("status", 500) >= 300
+                ]
+                metrics_dropped_total.inc(len(failed))
+                logger.error(
+                    "Elasticsearch rejected documents",
+                    rejected=len(failed),
+                    documents=count,
+                )
+            return response.status
+
+    async def _send_to_prometheus(self, metrics: AARMetric):
+        """Record metrics in the in-process Prometheus registry (scraped via /metrics)
 
-    async def _send_to_prometheus(self, metrics: Dict[str, Any]):
-        """Send metrics to Prometheus"""
-        logger.info(f"Prometheus metrics: {json.dumps(metrics, indent=2)}")
+        Processing duration is already observed by the API's
+        ``aar_processing_duration_seconds`` histogram, so only the compliance
+        score is recorded here.
+        """
+        aar_compliance_score.observe(metrics.compliance_score)
 
     async def _check_prometheus_health(self) -> Dict[str, Any]:
         """Check Prometheus health"""
+        if self.session is None:
+            return {"status": "unhealthy", "error": "not connected"}
         try:
-            url = f"{self.prometheus_url}/-/healthy"
-            async with self.session.get(url) as response:
+            async with self.session.get(self._prom_health_url) as response:
                 return {
                     "status": "healthy" if response.status == 200 else "unhealthy",
                     "response_code": response.status,
                 }
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             return {"status": "unhealthy", "error": str(e)}
 
     async def _check_elasticsearch_health(self) -> Dict[str, Any]:
         """Check Elasticsearch health"""
+        if self.session is None:
+            return {"status": "unhealthy", "error": "not connected"}
         try:
-            url = f"{self.elasticsearch_url}/_cluster/health"
-            async with self.session.get(url) as response:
+            async with self.session.get(
+                self._es_health_probe_url, timeout=_HEALTH_REQUEST_TIMEOUT
+            ) as response:
                 if response.status == 200:
-                    health_data = await response.json()
+                    health_data = orjson.loads(await response.read())
                     return {
                         "status": health_data.get("status", "unknown"),
                         "cluster_name": health_data.get("cluster_name", "unknown"),
@@ -183,35 +531,74 @@ class MonitoringIntegration:
                     }
                 else:
                     return {"status": "unhealthy", "response_code": response.status}
-        except Exception as e:
+        except (*_REQUEST_ERRORS, orjson.JSONDecodeError) as e:
             return {"status": "unhealthy", "error": str(e)}
 
     async def create_alert(
         self, alert_type: str, message: str, severity: str = "warning"
     ):
-        """Create monitoring alert"""
-        try:
-            alert_data = {
-                "alert_type": alert_type,
-                "message": message,
-                "severity": severity,
-                "timestamp": datetime.now().isoformat(),
-                "source": "aar-processor",
-            }
-
-            url = f"{self.elasticsearch_url}/alerts/_doc"
-            headers = {"Content-Type": "application/json"}
+        """Create monitoring alert
+
+        Alerts below the ``AAR_ALERT_MIN`` severity (default ``warning``) are
+        skipped without a request.
+        """
+        if _SEV_RANK.get(severity, len(_SEV_RANK)) < self._alert_min_rank:
+            return
+        if self.session is None:
+            logger.error(
+                "Failed to create alert", alert_type=alert_type, error="not connected"
+            )
+            return
+
+        alert_data = {
+            "alert_type": alert_type,
+            "message": message,
+            "severity": severity,
+            "timestamp": _now_iso(),
+            "source": "aar-processor",
+        }
 
+        try:
             async with self.session.post(
-                url, json=alert_data, headers=headers
+                self._alert_url, json=alert_data, headers=self._json_headers
             ) as response:
                 if response.status in [200, 201]:
-                    logger.info(f"Alert created: {alert_type} - {message}")
+                    logger.info("Alert created", alert_type=alert_type, message=message)
                 else:
-                    logger.error(f"Failed to create alert: {response.status}")
-
-        except Exception as e:
-            logger.error(f"Failed to create alert: {str(e)}")
+                    logger.error(
+                        "Failed to create alert",
+                        alert_type=alert_type,
+                        status=response.status,
+                    )
+
+        except _REQUEST_ERRORS as e:
+            logger.error("Failed to create alert", alert_type=alert_type, error=str(e))
+
+
+# Process-wide instance so the whole app shares one connection pool
+_instance: Optional[MonitoringIntegration] = None
+_instance_lock = asyncio.Lock()
+
+
+async def get_monitoring() -> MonitoringIntegration:
+    """Return the shared MonitoringIntegration, connecting it on first use"""
+    global _instance
+    if _instance is None:
+        async with _instance_lock:
+            if _instance is None:
+                monitoring = MonitoringIntegration()
+                await monitoring.connect()
+                _instance = monitoring
+    return _instance
+
+
+async def close_monitoring():
+    """Disconnect and forget the shared MonitoringIntegration"""
+    global _instance
+    async with _instance_lock:
+        if _instance is not None:
+            await _instance.disconnect()
+            _instance = None
 
 
 def get_sacred_geometry_context():
@@ -11,23 +11,302 @@ This module implements the fundamental Sacred Geometry patterns:
 - Fractal: Self-similar patterns at multiple scales
 """
 
+import copy
 import hashlib
 import json
 import math
+import re
+from array import array
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import cached_property, lru_cache
+from itertools import pairwise
+from typing import Any, Dict, Final, List, Optional, Tuple
 
+import numpy as np
+import orjson
 import structlog
+from cachetools import LRUCache
 
 logger = structlog.get_logger(__name__)
 
 
+# Keyword sets scanned for by the pattern helpers
+_ERROR_INDICATORS: Final[Tuple[str, ...]] = (
+    "error",
+    "exception",
+    "try",
+    "catch",
+    "finally",
+    "handle",
+)
+_SEQUENTIAL_INDICATORS: Final[Tuple[str, ...]] = (
+    "step",
+    "phase",
+    "iteration",
+    "version",
+    "level",
+)
+_ITERATION_INDICATORS: Final[Tuple[str, ...]] = (
+    "improve",
+    "enhance",
+    "refine",
+    "iterate",
+    "evolve",
+)
+_CONTEXT_FIELDS: Final[Tuple[str, ...]] = (
+    "context",
+    "background",
+    "environment",
+    "situation",
+    "scope",
+)
+_ERROR_INDICATORS_LEN: Final = len(_ERROR_INDICATORS)
+_SEQUENTIAL_INDICATORS_LEN: Final = len(_SEQUENTIAL_INDICATORS)
+_ITERATION_INDICATORS_LEN: Final = len(_ITERATION_INDICATORS)
+_CONTEXT_FIELDS_LEN: Final = len(_CONTEXT_FIELDS)
+
+# Key fragments used by the key-based heuristics
+_TIMESTAMP_KEY_PARTS: Final[Tuple[str, ...]] = ("time", "date", "created", "updated")
+_META_KEY_PARTS: Final[Tuple[str, ...]] = ("meta", "context", "info", "config")
+
+_ALL_INDICATORS = frozenset(
+    _ERROR_INDICATORS + _SEQUENTIAL_INDICATORS + _ITERATION_INDICATORS + _CONTEXT_FIELDS
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_scanner(
+    keywords: frozenset,
+) -> Tuple["re.Pattern[str]", Dict[str, frozenset]]:
+    """Build a single-pass substring scanner for a set of keywords
+
+    One alternation over every keyword, longest first, inside a lookahead so a
+    single finditer sweep reports matches at every offset (overlaps included).
+    The sweep reports the longest keyword at each offset; any shorter keyword
+    that is a prefix of it is present at that offset too, which the returned
+    prefix closure accounts for.
+    """
+    pattern = re.compile(
+        "(?=("
+        + "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+        + "))"
+    )
+    closure = {
+        keyword: frozenset(k for k in keywords if keyword.startswith(k))
+        for keyword in keywords
+    }
+    return pattern, closure
+
+
+_INDICATOR_SCAN, _PREFIX_CLOSURE = _compile_scanner(_ALL_INDICATORS)
+
+# Numbers embedded in string values
+_NUM_RE = re.compile(r"-?\d+\.?\d*")
+
+# Small integer codes for the value types seen in JSON payloads; anything
+# else shares the final bucket
+_TYPE_CODE: Final[Dict[type, int]] = {
+    dict: 0,
+    list: 1,
+    str: 2,
+    int: 3,
+    float: 4,
+    bool: 5,
+    type(None): 6,
+}
+_TYPE_CODE_OTHER: Final = len(_TYPE_CODE)
+
+
+def _scan_keywords(text: str, keywords: frozenset = _ALL_INDICATORS) -> frozenset:
+    """Return every keyword occurring in ``text`` in one pass"""
+    scanner, closure = _compile_scanner(keywords)
+    found = set()
+    for match in scanner.finditer(text):
+        found |= closure[match.group(1)]
+    return frozenset(found)
+
+
+# Scalar types whose JSON encoding no other value shares
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_json_native(data: Any) -> bool:
+    """Whether ``data`` holds only dicts with str keys, lists and JSON scalars
+
+    Anything else (tuples, non-str keys, NaN, subclasses) can serialize to
+    the same JSON as a different payload that the patterns score apart.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        kind = type(obj)
+        if kind is dict:
+            for key, value in obj.items():
+                if type(key) is not str:
+                    return False
+                stack.append(value)
+        elif kind is list:
+            stack.extend(obj)
+        elif kind not in _JSON_SCALAR_TYPES:
+            return False
+        elif kind is float and not math.isfinite(obj):
+            return False
+    return True
+
+
+# Stack markers used by _walk_tree
+_NO_KEY = object()
+_LEAVE = object()
+
+
+def _walk_tree(data: Any, level: int = 0) -> Dict[str, Any]:
+    """Collect every structural statistic the fractal/triangle helpers need
+
+    One iterative pass replaces the separate recursive walks for nesting
+    levels, scale counts, max depth, structure patterns and recursive keys.
+    ``level`` is the nesting level assigned to ``data`` itself.
+
+    ``level_counts`` is a list indexed by nesting level, and structure
+    patterns are keyed by ``(is_list, level, size)`` tuples.
+    """
+    # Levels below the starting one are left at zero
+    level_counts: List[int] = [0] * (level + 1)
+    structure_patterns: Dict[Tuple[bool, int, int], int] = {}
+    recursive_hits = 0
+    nodes = 0
+    # Multiset of the dict keys leading to the node being visited, kept up
+    # to date with enter/leave markers instead of copying a path per node
+    on_path: Dict[Any, int] = {}
+
+    # (node, nesting level, dict key the node sits under)
+    stack: List[Tuple[Any, int, Any]] = [(data, level, _NO_KEY)]
+    while stack:
+        obj, level, key = stack.pop()
+        if obj is _LEAVE:
+            if on_path[key] == 1:
+                del on_path[key]
+            else:
+                on_path[key] -= 1
+            continue
+
+        nodes += 1
+        # A node is only reached after its parent, so the list never needs
+        # to grow by more than one level at a time
+        if level == len(level_counts):
+            level_counts.append(1)
+        else:
+            level_counts[level] += 1
+
+        if isinstance(obj, dict):
+            pattern_key = (False, level, len(obj))
+        elif isinstance(obj, list):
+            pattern_key = (True, level, len(obj))
+        else:
+            continue
+        structure_patterns[pattern_key] = structure_patterns.get(pattern_key, 0) + 1
+        if not obj:
+            continue
+
+        if key is not _NO_KEY:
+            on_path[key] = on_path.get(key, 0) + 1
+            stack.append((_LEAVE, level, key))
+        if isinstance(obj, dict):
+            for child_key, value in obj.items():
+                if child_key in on_path:  # Recursive reference detected
+                    recursive_hits += 1
+                stack.append((value, level + 1, child_key))
+        else:
+            for item in obj:
+                stack.append((item, level + 1, _NO_KEY))
+
+    return {
+        "level_counts": level_counts,
+        "max_depth": len(level_counts) - 1,
+        "structure_patterns": structure_patterns,
+        "recursive_hits": recursive_hits,
+        "nodes": nodes,
+    }
+
+
+class _ScanContext:
+    """Per-call views of ``data`` shared by the pattern helpers
+
+    Each view is computed on first use and reused by every later helper, so
+    a ``validate_data`` call serializes and walks ``data`` once.
+    """
+
+    def __init__(self, engine: "SacredGeometryEngine", data: Any) -> None:
+        self._engine = engine
+        self.data = data
+
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """Compact UTF-8 JSON encoding of the data"""
+        try:
+            return orjson.dumps(self.data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects some values the stdlib encodes, e.g. ints
+            # wider than 64 bits
+            return json.dumps(self.data, separators=(",", ":")).encode()
+
+    @cached_property
+    def lower_json(self) -> str:
+        # bytes.lower() folds ASCII only, which is all the keywords use
+        return self.json_bytes.lower().decode()
+
+    @cached_property
+    def fingerprint(self) -> Optional[bytes]:
+        """Digest of the serialized data, or None if it isn't JSON-serializable"""
+        try:
+            serialized = self.json_bytes
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(serialized, digest_size=16).digest()
+
+    @cached_property
+    def cache_fingerprint(self) -> Optional[bytes]:
+        """Fingerprint safe to cache on, or None unless the data is JSON-native"""
+        if not _is_json_native(self.data):
+            return None
+        return self.fingerprint
+
+    @cached_property
+    def keyword_hits(self) -> frozenset:
+        """Indicator keywords found anywhere in the serialized data"""
+        return _scan_keywords(self.lower_json)
+
+    @cached_property
+    def lowered_keys(self) -> Tuple[str, ...]:
+        """Top-level keys, lowercased, in insertion order"""
+        return tuple(str(key).lower() for key in self.data)
+
+    @cached_property
+    def key_hits(self) -> frozenset:
+        """Indicator keywords found in the top-level keys"""
+        # Newlines never occur in keywords, so no match spans two keys
+        return _scan_keywords("\n".join(self.lowered_keys))
+
+    @cached_property
+    def numbers(self) -> np.ndarray:
+        return self._engine._extract_numbers_from_data(self.data)
+
+    @cached_property
+    def tree(self) -> Dict[str, Any]:
+        return _walk_tree(self.data)
+
+
 class SacredGeometryEngine:
     """Core Sacred Geometry processing engine"""
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.phi = (1 + math.sqrt(5)) / 2  # Golden Ratio φ = PHI...
+        self._phi_inv = 1.0 / self.phi
+        self._phi_str = str(self.phi)
+        # AAR IDs keep the Golden Ratio share of a 64-hex-char digest
+        self._aar_id_hex_len = int(64 * self._phi_inv)
         self.is_initialized = False
+        # Validation is deterministic, so repeat payloads reuse their results
+        self._validation_cache: LRUCache = LRUCache(maxsize=1024)
         self.patterns = {
             "circle": self._circle_pattern,
             "triangle": self._triangle_pattern,
@@ -36,7 +315,7 @@ class SacredGeometryEngine:
             "fractal": self._fractal_pattern,
         }
 
-    async def initialize(self):
+    async def initialize(self) -> None:
         """Initialize Sacred Geometry engine"""
         logger.info("🌀 Initializing Sacred Geometry Engine")
 
@@ -51,7 +330,7 @@ class SacredGeometryEngine:
         self.is_initialized = True
         logger.info("✅ Sacred Geometry Engine initialized", phi=self.phi)
 
-    async def _initialize_patterns(self):
+    async def _initialize_patterns(self) -> None:
         """Initialize Sacred Geometry pattern processors"""
         # Pre-compute common Golden Ratio values
         self.phi_powers = {0: 1, 1: self.phi, 2: self.phi**2, 3: self.phi**3}
@@ -60,6 +339,10 @@ class SacredGeometryEngine:
         self.fibonacci = [1, 1]
         for i in range(2, 20):
             self.fibonacci.append(self.fibonacci[i - 1] + self.fibonacci[i - 2])
+        # Hashed and array forms for membership tests; the array is float so
+        # scan values are compared without an integer cast (exact below 2**53)
+        self.fibonacci_set = frozenset(self.fibonacci)
+        self._fib_np = np.array(sorted(self.fibonacci_set), dtype=np.float64)
 
         logger.debug(
             "Pattern processors initialized",
@@ -75,19 +358,22 @@ class SacredGeometryEngine:
         """Validate that requested patterns are supported"""
         return all(pattern in self.patterns for pattern in patterns)
 
-    def generate_aar_id(self, mission_id: str) -> str:
-        """Generate AAR ID using Sacred Geometry principles"""
-        # Use Golden Ratio to create unique but meaningful IDs
-        timestamp = datetime.now().isoformat()
-        combined = f"{mission_id}_{timestamp}_{self.phi}"
+    def generate_aar_id(self, mission_id: str, now_iso: Optional[str] = None) -> str:
+        """Generate AAR ID using Sacred Geometry principles
 
-        # Create hash and apply Golden Ratio proportioning
-        hash_obj = hashlib.sha256(combined.encode())
-        hex_digest = hash_obj.hexdigest()
+        ``now_iso`` lets a caller that already has the request timestamp pass
+        it in; it must differ between IDs generated for the same mission.
+        """
+        # Use Golden Ratio to create unique but meaningful IDs
+        timestamp = now_iso or datetime.now().isoformat()
+        combined = f"{mission_id}_{timestamp}_{self._phi_str}"
 
-        # Extract Golden Ratio proportioned sections
-        phi_section = int(len(hex_digest) / self.phi)
-        aar_id = hex_digest[:phi_section]
+        # Hash only as many bytes as the Golden Ratio proportioned ID needs
+        phi_section = self._aar_id_hex_len
+        hash_obj = hashlib.blake2b(
+            combined.encode(), digest_size=(phi_section + 1) // 2
+        )
+        aar_id = hash_obj.hexdigest()[:phi_section]
 
         logger.debug(
             "Generated AAR ID",
@@ -98,15 +384,47 @@ class SacredGeometryEngine:
 
         return f"aar_{aar_id}"
 
-    async def validate_data(self, data: Dict) -> Dict[str, Any]:
-        """Validate data against Sacred Geometry patterns"""
-        validation_results = {}
+    def _prepare_scan_context(self, data: Any) -> _ScanContext:
+        """Create the shared scan context for one validation of ``data``"""
+        return _ScanContext(self, data)
+
+    async def validate_data(
+        self, data: Dict, now_iso: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Validate data against Sacred Geometry patterns
 
-        for pattern_name in self.patterns:
+        ``now_iso`` is used as the result timestamp when the caller already
+        has one for the request.
+        """
+        now_iso = now_iso or datetime.now().isoformat()
+        validation_results = {}
+        scan = self._prepare_scan_context(data)
+
+        fingerprint = scan.cache_fingerprint
+        # The pattern table is part of the key, so replacing an entry never
+        # serves results computed by the pattern it replaced
+        cache_key = (
+            (fingerprint, tuple(self.patterns.items()))
+            if fingerprint is not None
+            else None
+        )
+        cached = (
+            self._validation_cache.get(cache_key) if cache_key is not None else None
+        )
+        if cached is not None:
+            result = copy.deepcopy(cached)
+            result["timestamp"] = now_iso
+            return result
+
+        # The pattern checks are plain CPU work, so they are called directly
+        # rather than scheduled as coroutines; the overall tallies are kept
+        # as the results come in
+        valid_patterns = 0
+        score_total = 0
+        for pattern_name, pattern in self.patterns.items():
             try:
-                pattern_func = self.patterns[pattern_name]
-                result = await pattern_func(data, validate_only=True)
-                validation_results[pattern_name] = {
+                result = pattern(data, validate_only=True, scan=scan)
+                entry = {
                     "valid": result.get("valid", False),
                     "score": result.get("score", 0.0),
                     "details": result.get("details", {}),
@@ -115,30 +433,34 @@ class SacredGeometryEngine:
                 logger.error(
                     "Pattern validation failed", pattern=pattern_name, error=str(e)
                 )
-                validation_results[pattern_name] = {
+                entry = {
                     "valid": False,
                     "score": 0.0,
                     "error": str(e),
                 }
+            validation_results[pattern_name] = entry
+            if entry["valid"]:
+                valid_patterns += 1
+            score_total += entry["score"]
 
         # Calculate overall compliance
-        valid_patterns = sum(
-            1 for r in validation_results.values() if r.get("valid", False)
-        )
-        overall_score = sum(
-            r.get("score", 0) for r in validation_results.values()
-        ) / len(validation_results)
-
-        return {
-            "overall_compliance": overall_score,
+        total_patterns = len(validation_results)
+        result = {
+            "overall_compliance": score_total / total_patterns,
             "valid_patterns": valid_patterns,
-            "total_patterns": len(validation_results),
+            "total_patterns": total_patterns,
             "pattern_results": validation_results,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
         }
-
-    async def _circle_pattern(
-        self, data: Dict, validate_only: bool = False
+        if cache_key is not None:
+            self._validation_cache[cache_key] = copy.deepcopy(result)
+        return result
+
+    def _circle_pattern(
+        self,
+        data: Dict,
+        validate_only: bool = False,
+        scan: Optional[_ScanContext] = None,
     ) -> Dict[str, Any]:
         """Circle: Complete functionality, proper error handling"""
         try:
@@ -153,11 +475,13 @@ class SacredGeometryEngine:
                     "details": {"missing_fields": missing_fields},
                 }
 
+            scan = scan or self._prepare_scan_context(data)
+
             # Check for circularity - data references form complete cycles
-            circular_score = self._calculate_circular_completeness(data)
+            circular_score = self._calculate_circular_completeness(data, scan)
 
             # Check for proper error handling patterns
-            error_handling_score = self._check_error_handling_patterns(data)
+            error_handling_score = self._check_error_handling_patterns(data, scan)
 
             overall_score = (circular_score + error_handling_score) / 2
 
@@ -175,15 +499,20 @@ class SacredGeometryEngine:
             logger.error("Circle pattern validation failed", error=str(e))
             return {"valid": False, "score": 0.0, "error": str(e)}
 
-    async def _triangle_pattern(
-        self, data: Dict, validate_only: bool = False
+    def _triangle_pattern(
+        self,
+        data: Dict,
+        validate_only: bool = False,
+        scan: Optional[_ScanContext] = None,
     ) -> Dict[str, Any]:
         """Triangle: Stable architecture with three-tier validation"""
         try:
+            scan = scan or self._prepare_scan_context(data)
+
             # Three-tier validation: Structure, Content, Context
-            structure_score = self._validate_structural_integrity(data)
+            structure_score = self._validate_structural_integrity(data, scan)
             content_score = self._validate_content_quality(data)
-            context_score = self._validate_contextual_relevance(data)
+            context_score = self._validate_contextual_relevance(data, scan)
 
             # Triangular stability check - all three tiers must be balanced
             scores = [structure_score, content_score, context_score]
@@ -206,22 +535,27 @@ class SacredGeometryEngine:
             logger.error("Triangle pattern validation failed", error=str(e))
             return {"valid": False, "score": 0.0, "error": str(e)}
 
-    async def _spiral_pattern(
-        self, data: Dict, validate_only: bool = False
+    def _spiral_pattern(
+        self,
+        data: Dict,
+        validate_only: bool = False,
+        scan: Optional[_ScanContext] = None,
     ) -> Dict[str, Any]:
         """Spiral: Progressive enhancement and iterative improvement"""
         try:
+            scan = scan or self._prepare_scan_context(data)
+
             # Check for spiral growth patterns in data
-            spiral_growth = self._detect_spiral_growth(data)
+            spiral_growth = self._detect_spiral_growth(data, scan)
 
             # Check for iterative improvement indicators
-            iteration_quality = self._assess_iteration_quality(data)
+            iteration_quality = self._assess_iteration_quality(data, scan)
 
             # Check for progressive enhancement patterns
-            enhancement_progression = self._evaluate_enhancement_progression(data)
+            enhancement_progression = self._evaluate_enhancement_progression(data, scan)
 
             # Fibonacci-based scoring
-            fib_alignment = self._check_fibonacci_alignment(data)
+            fib_alignment = self._check_fibonacci_alignment(data, scan)
 
             overall_score = (
                 spiral_growth
@@ -245,19 +579,24 @@ class SacredGeometryEngine:
             logger.error("Spiral pattern validation failed", error=str(e))
             return {"valid": False, "score": 0.0, "error": str(e)}
 
-    async def _golden_ratio_pattern(
-        self, data: Dict, validate_only: bool = False
+    def _golden_ratio_pattern(
+        self,
+        data: Dict,
+        validate_only: bool = False,
+        scan: Optional[_ScanContext] = None,
     ) -> Dict[str, Any]:
         """Golden Ratio: Optimal proportions in API design (φ = PHI)"""
         try:
+            scan = scan or self._prepare_scan_context(data)
+
             # Check proportional relationships in data structure
-            proportion_score = self._analyze_proportional_relationships(data)
+            proportion_score = self._analyze_proportional_relationships(data, scan)
 
             # Check for Golden Ratio in numerical values
-            numerical_golden_ratio = self._find_golden_ratios_in_values(data)
+            numerical_golden_ratio = self._find_golden_ratios_in_values(data, scan)
 
             # Check for optimal API design proportions
-            api_design_score = self._evaluate_api_design_proportions(data)
+            api_design_score = self._evaluate_api_design_proportions(data, scan)
 
             # Overall Golden Ratio compliance
             overall_score = (
@@ -279,22 +618,27 @@ class SacredGeometryEngine:
             logger.error("Golden Ratio pattern validation failed", error=str(e))
             return {"valid": False, "score": 0.0, "error": str(e)}
 
-    async def _fractal_pattern(
-        self, data: Dict, validate_only: bool = False
+    def _fractal_pattern(
+        self,
+        data: Dict,
+        validate_only: bool = False,
+        scan: Optional[_ScanContext] = None,
     ) -> Dict[str, Any]:
         """Fractal: Self-similar patterns at multiple scales"""
         try:
+            scan = scan or self._prepare_scan_context(data)
+
             # Check for self-similarity at different scales
-            self_similarity = self._detect_self_similarity(data)
+            self_similarity = self._detect_self_similarity(data, scan)
 
             # Check for recursive patterns
-            recursive_patterns = self._analyze_recursive_patterns(data)
+            recursive_patterns = self._analyze_recursive_patterns(data, scan)
 
             # Check for scale invariance
-            scale_invariance = self._evaluate_scale_invariance(data)
+            scale_invariance = self._evaluate_scale_invariance(data, scan)
 
             # Check for fractal dimensions
-            fractal_dimension = self._calculate_fractal_dimension(data)
+            fractal_dimension = self._calculate_fractal_dimension(data, scan)
 
             overall_score = (
                 self_similarity
@@ -320,7 +664,9 @@ class SacredGeometryEngine:
 
     # Helper methods for pattern validation
 
-    def _calculate_circular_completeness(self, data: Dict) -> float:
+    def _calculate_circular_completeness(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Calculate how complete/circular the data structure is"""
         # Simple heuristic: check for cross-references and completeness
         total_fields = len(data)
@@ -329,36 +675,45 @@ class SacredGeometryEngine:
 
         # Count fields that reference other fields (circular references)
         circular_refs = 0
-        for key, value in data.items():
+        key_owners: Optional[Dict[str, int]] = None
+        lowered = (scan or self._prepare_scan_context(data)).lowered_keys
+        for own_key, value in zip(lowered, data.values()):
             if isinstance(value, (dict, list)):
+                if key_owners is None:
+                    # Lowered key -> number of original keys lowering to it
+                    key_owners = {}
+                    for other_key in lowered:
+                        key_owners[other_key] = key_owners.get(other_key, 0) + 1
+                    lowered_keys = frozenset(key_owners)
+
                 # Check for references to other keys in the data
-                value_str = str(value).lower()
-                for other_key in data.keys():
-                    if other_key != key and other_key.lower() in value_str:
-                        circular_refs += 1
-                        break
+                found = _scan_keywords(str(value).lower(), lowered_keys)
+                if any(k != own_key or key_owners[k] > 1 for k in found):
+                    circular_refs += 1
 
         return min(circular_refs / total_fields, 1.0)
 
-    def _check_error_handling_patterns(self, data: Dict) -> float:
+    def _check_error_handling_patterns(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Check for proper error handling patterns in data"""
-        error_indicators = ["error", "exception", "try", "catch", "finally", "handle"]
-
-        data_str = json.dumps(data).lower()
-        found_indicators = sum(
-            1 for indicator in error_indicators if indicator in data_str
-        )
+        hits = (scan or self._prepare_scan_context(data)).keyword_hits
+        found_indicators = len(hits.intersection(_ERROR_INDICATORS))
 
-        return min(found_indicators / len(error_indicators), 1.0)
+        return min(found_indicators / _ERROR_INDICATORS_LEN, 1.0)
 
-    def _validate_structural_integrity(self, data: Dict) -> float:
+    def _validate_structural_integrity(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Validate structural integrity (Triangle tier 1)"""
         try:
+            scan = scan or self._prepare_scan_context(data)
+
             # Check for well-formed JSON structure
-            json.dumps(data)
+            scan.lower_json
 
             # Check for reasonable nesting depth (< 10 levels)
-            max_depth = self._calculate_max_depth(data)
+            max_depth = scan.tree["max_depth"]
             depth_score = max(0, 1 - (max_depth - 5) / 10) if max_depth > 5 else 1.0
 
             # Check for balanced structure
@@ -385,53 +740,46 @@ class SacredGeometryEngine:
 
         return meaningful_fields / total_fields if total_fields > 0 else 0.0
 
-    def _validate_contextual_relevance(self, data: Dict) -> float:
+    def _validate_contextual_relevance(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Validate contextual relevance (Triangle tier 3)"""
         # Check for context-related fields
-        context_fields = ["context", "background", "environment", "situation", "scope"]
-
-        context_score = 0
-        for field in context_fields:
-            if any(field in str(key).lower() for key in data.keys()):
-                context_score += 1
+        hits = (scan or self._prepare_scan_context(data)).key_hits
+        context_score = len(hits.intersection(_CONTEXT_FIELDS))
 
-        return min(context_score / len(context_fields), 1.0)
+        return min(context_score / _CONTEXT_FIELDS_LEN, 1.0)
 
-    def _detect_spiral_growth(self, data: Dict) -> float:
+    def _detect_spiral_growth(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Detect spiral growth patterns in data"""
         # Look for sequential or progressive data structures
-        sequential_indicators = ["step", "phase", "iteration", "version", "level"]
+        hits = (scan or self._prepare_scan_context(data)).keyword_hits
+        found_sequences = len(hits.intersection(_SEQUENTIAL_INDICATORS))
 
-        data_str = json.dumps(data).lower()
-        found_sequences = sum(
-            1 for indicator in sequential_indicators if indicator in data_str
-        )
+        return min(found_sequences / _SEQUENTIAL_INDICATORS_LEN, 1.0)
 
-        return min(found_sequences / len(sequential_indicators), 1.0)
-
-    def _assess_iteration_quality(self, data: Dict) -> float:
+    def _assess_iteration_quality(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Assess iteration quality indicators"""
-        iteration_indicators = ["improve", "enhance", "refine", "iterate", "evolve"]
-
-        data_str = json.dumps(data).lower()
-        found_iterations = sum(
-            1 for indicator in iteration_indicators if indicator in data_str
-        )
+        hits = (scan or self._prepare_scan_context(data)).keyword_hits
+        found_iterations = len(hits.intersection(_ITERATION_INDICATORS))
 
-        return min(found_iterations / len(iteration_indicators), 1.0)
+        return min(found_iterations / _ITERATION_INDICATORS_LEN, 1.0)
 
-    def _evaluate_enhancement_progression(self, data: Dict) -> float:
+    def _evaluate_enhancement_progression(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Evaluate progressive enhancement patterns"""
         # Look for version numbers, timestamps, or progression indicators
         if isinstance(data, dict):
+            lowered_keys = (scan or self._prepare_scan_context(data)).lowered_keys
             # Check for versioning patterns
-            version_fields = [
-                k for k in data.keys() if "version" in k.lower() or "v" in k.lower()
-            ]
+            version_fields = [k for k in lowered_keys if "version" in k or "v" in k]
             timestamp_fields = [
-                k
-                for k in data.keys()
-                if any(t in k.lower() for t in ["time", "date", "created", "updated"])
+                k for k in lowered_keys if any(t in k for t in _TIMESTAMP_KEY_PARTS)
             ]
 
             progression_score = (
@@ -441,51 +789,64 @@ class SacredGeometryEngine:
 
         return 0.5  # Default moderate score
 
-    def _check_fibonacci_alignment(self, data: Dict) -> float:
+    def _check_fibonacci_alignment(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Check for Fibonacci sequence alignment in data"""
         # Look for numerical values that align with Fibonacci sequence
-        numbers = self._extract_numbers_from_data(data)
-        if not numbers:
+        numbers = (scan or self._prepare_scan_context(data)).numbers
+        if not numbers.size:
             return 0.5
 
-        fib_matches = 0
-        for num in numbers:
-            if int(num) in self.fibonacci:
-                fib_matches += 1
+        # Truncate toward zero like int() before the membership test. NaN and
+        # infinities never match but still count toward the denominator
+        finite = numbers[np.isfinite(numbers)]
+        fib_matches = int(np.count_nonzero(np.isin(np.trunc(finite), self._fib_np)))
 
-        return min(fib_matches / len(numbers), 1.0)
+        return min(fib_matches / numbers.size, 1.0)
 
-    def _analyze_proportional_relationships(self, data: Dict) -> float:
+    def _analyze_proportional_relationships(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Analyze proportional relationships for Golden Ratio compliance"""
-        numbers = self._extract_numbers_from_data(data)
-        if len(numbers) < 2:
+        numbers = (scan or self._prepare_scan_context(data)).numbers
+        if numbers.size < 2:
             return 0.5
 
-        ratios = []
-        for i in range(len(numbers) - 1):
-            if numbers[i] != 0:
-                ratio = numbers[i + 1] / numbers[i]
-                ratios.append(ratio)
-
-        if not ratios:
+        # Ratios of consecutive values; zero denominators are masked out
+        # rather than filtered, so no compacted copies are made
+        denominators = numbers[:-1]
+        nonzero = denominators != 0
+        ratio_count = int(np.count_nonzero(nonzero))
+        if not ratio_count:
             return 0.5
 
+        ratios = np.divide(
+            numbers[1:], denominators, out=np.zeros_like(denominators), where=nonzero
+        )
+
         # Check how many ratios are close to Golden Ratio
-        golden_ratio_matches = sum(1 for r in ratios if abs(r - self.phi) < 0.1)
+        ratios -= self.phi
+        np.abs(ratios, out=ratios)
+        golden_ratio_matches = int(np.count_nonzero((ratios < 0.1) & nonzero))
 
-        return min(golden_ratio_matches / len(ratios), 1.0)
+        return min(golden_ratio_matches / ratio_count, 1.0)
 
-    def _find_golden_ratios_in_values(self, data: Dict) -> float:
+    def _find_golden_ratios_in_values(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Find Golden Ratio occurrences in numerical values"""
-        numbers = self._extract_numbers_from_data(data)
-        if not numbers:
+        numbers = (scan or self._prepare_scan_context(data)).numbers
+        if not numbers.size:
             return 0.5
 
-        golden_matches = sum(1 for num in numbers if abs(num - self.phi) < 0.01)
+        golden_matches = int(np.count_nonzero(np.abs(numbers - self.phi) < 0.01))
 
-        return min(golden_matches / len(numbers), 1.0)
+        return min(golden_matches / numbers.size, 1.0)
 
-    def _evaluate_api_design_proportions(self, data: Dict) -> float:
+    def _evaluate_api_design_proportions(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Evaluate API design proportions against Golden Ratio"""
         if not isinstance(data, dict):
             return 0.0
@@ -499,10 +860,8 @@ class SacredGeometryEngine:
         content_fields = 0
         meta_fields = 0
 
-        for key in data.keys():
-            if any(
-                meta in key.lower() for meta in ["meta", "context", "info", "config"]
-            ):
+        for key in (scan or self._prepare_scan_context(data)).lowered_keys:
+            if any(meta in key for meta in _META_KEY_PARTS):
                 meta_fields += 1
             else:
                 content_fields += 1
@@ -511,7 +870,7 @@ class SacredGeometryEngine:
             return 0.0
 
         content_ratio = content_fields / total_fields
-        optimal_content_ratio = 1 / self.phi  # ≈ 0.618
+        optimal_content_ratio = self._phi_inv  # ≈ 0.618
 
         # Score based on how close we are to the golden ratio
         ratio_deviation = abs(content_ratio - optimal_content_ratio)
@@ -519,13 +878,15 @@ class SacredGeometryEngine:
 
         return score
 
-    def _detect_self_similarity(self, data: Dict) -> float:
+    def _detect_self_similarity(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Detect self-similar patterns in data structure"""
         if not isinstance(data, dict):
             return 0.0
         # Check for similar structures at different levels
-        structure_patterns: Dict[str, int] = {}
-        self._analyze_structure_patterns(data, structure_patterns, 0)
+        tree = (scan or self._prepare_scan_context(data)).tree
+        structure_patterns = tree["structure_patterns"]
 
         # Count how many patterns repeat
         repeated_patterns = sum(
@@ -535,193 +896,144 @@ class SacredGeometryEngine:
 
         return repeated_patterns / total_patterns if total_patterns > 0 else 0.0
 
-    def _analyze_recursive_patterns(self, data: Dict) -> float:
+    def _analyze_recursive_patterns(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Analyze recursive patterns in data"""
-        # Look for recursive structures or references
-        recursive_score = 0
-        total_checks = 0
-
-        def check_recursion(obj, path=[]):
-            nonlocal recursive_score, total_checks
-            total_checks += 1
-
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key in path:  # Recursive reference detected
-                        recursive_score += 1
-                    check_recursion(value, path + [key])
-            elif isinstance(obj, list):
-                for item in obj:
-                    check_recursion(item, path)
-
-        check_recursion(data)
+        # Look for keys repeated along a path (recursive structures)
+        tree = (scan or self._prepare_scan_context(data)).tree
+        recursive_score = tree["recursive_hits"]
+        total_checks = tree["nodes"]
 
         return recursive_score / total_checks if total_checks > 0 else 0.0
 
-    def _evaluate_scale_invariance(self, data: Dict) -> float:
+    def _evaluate_scale_invariance(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Evaluate scale invariance properties"""
         # Check if patterns remain consistent at different scales
         # This is a simplified heuristic
         if not isinstance(data, dict):
             return 0.0
         # Count nesting levels and their consistency
-        level_counts: Dict[int, int] = {}
-        self._count_nesting_levels(data, level_counts, 0)
+        tree = (scan or self._prepare_scan_context(data)).tree
+        level_counts = tree["level_counts"]
 
         if not level_counts:
             return 0.0
 
-        # Check if distribution follows power law (fractal characteristic)
-        levels = sorted(level_counts.keys())
-        if len(levels) < 2:
+        # Check if distribution follows power law (fractal characteristic);
+        # every level down to the deepest holds at least one element
+        if len(level_counts) < 2:
             return 0.5
 
         # Simple power law check
         consistency_score = 0
-        for i in range(len(levels) - 1):
-            ratio = (
-                level_counts[levels[i]] / level_counts[levels[i + 1]]
-                if level_counts[levels[i + 1]] > 0
-                else 1
-            )
+        for upper, lower in pairwise(level_counts):
+            ratio = upper / lower
             if 1.5 <= ratio <= 3.0:  # Reasonable power law range
                 consistency_score += 1
 
-        return consistency_score / (len(levels) - 1) if len(levels) > 1 else 0.5
+        return consistency_score / (len(level_counts) - 1)
 
-    def _calculate_fractal_dimension(self, data: Dict) -> float:
+    def _calculate_fractal_dimension(
+        self, data: Dict, scan: Optional[_ScanContext] = None
+    ) -> float:
         """Calculate approximate fractal dimension of data structure"""
         # Simplified fractal dimension calculation
         if not isinstance(data, dict):
             return 0.0
-        # Count elements at each scale (nesting level)
-        scale_counts: Dict[int, int] = {}
-        self._count_elements_by_scale(data, scale_counts, 1)
+        # Count elements at each scale; scale doubles with each nesting level
+        level_counts = (scan or self._prepare_scan_context(data)).tree["level_counts"]
 
-        if len(scale_counts) < 2:
+        if len(level_counts) < 2:
             return 0.5
 
-        # Calculate dimension using box-counting method approximation
-        scales = sorted(scale_counts.keys())
-        if len(scales) < 2:
-            return 0.5
-
-        # Use first and last scale for simplification
-        first_scale = scales[0]
-        last_scale = scales[-1]
-
-        if scale_counts[last_scale] == 0 or first_scale == last_scale:
-            return 0.5
+        # Calculate dimension using box-counting method approximation,
+        # using the first and last scale for simplification
+        first_scale = 1
+        last_scale = 2 ** (len(level_counts) - 1)
 
-        dimension = math.log(
-            scale_counts[first_scale] / scale_counts[last_scale]
-        ) / math.log(last_scale / first_scale)
+        dimension = math.log(level_counts[0] / level_counts[-1]) / math.log(
+            last_scale / first_scale
+        )
 
         # Normalize to 0-1 range
         return min(abs(dimension) / 3, 1.0)
 
     # Utility methods
 
-    def _extract_numbers_from_data(self, data: Any) -> List[float]:
-        """Extract all numerical values from data structure"""
-        numbers = []
-
-        def extract_recursive(obj):
+    def _extract_numbers_from_data(self, data: Any) -> np.ndarray:
+        """Extract all numerical values from data structure, in traversal order"""
+        # Numbers go straight into a C double buffer that NumPy then wraps
+        # without copying; containers are pushed in reverse so the stack
+        # pops them in document order
+        buf = array("d")
+        stack = [data]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, (int, float)):
-                numbers.append(float(obj))
+                buf.append(obj)
             elif isinstance(obj, dict):
-                for value in obj.values():
-                    extract_recursive(value)
+                stack.extend(reversed(obj.values()))
             elif isinstance(obj, list):
-                for item in obj:
-                    extract_recursive(item)
+                stack.extend(reversed(obj))
             elif isinstance(obj, str):
                 # Try to extract numbers from strings
-                import re
+                buf.extend(map(float, _NUM_RE.findall(obj)))
 
-                found_numbers = re.findall(r"-?\d+\.?\d*", obj)
-                for num_str in found_numbers:
-                    try:
-                        numbers.append(float(num_str))
-                    except ValueError:
-                        pass
-
-        extract_recursive(data)
-        return numbers
+        return np.frombuffer(buf, dtype=np.float64)
 
     def _calculate_max_depth(self, obj: Any, current_depth: int = 0) -> int:
         """Calculate maximum nesting depth of data structure"""
-        if isinstance(obj, dict):
-            if not obj:
-                return current_depth
-            return max(
-                self._calculate_max_depth(value, current_depth + 1)
-                for value in obj.values()
-            )
-        elif isinstance(obj, list):
-            if not obj:
-                return current_depth
-            return max(
-                self._calculate_max_depth(item, current_depth + 1) for item in obj
-            )
-        else:
-            return current_depth
+        return _walk_tree(obj, current_depth)["max_depth"]
 
     def _calculate_structure_balance(self, data: Dict) -> float:
         """Calculate structural balance of data"""
         if not data:
             return 0.0
         # Check balance between different value types
-        type_counts: Dict[str, int] = {}
-        for value in data.values():
-            value_type = type(value).__name__
-            type_counts[value_type] = type_counts.get(value_type, 0) + 1
-
-        if not type_counts:
-            return 0.0
+        codes = np.fromiter(
+            (_TYPE_CODE.get(type(value), _TYPE_CODE_OTHER) for value in data.values()),
+            dtype=np.int8,
+            count=len(data),
+        )
+        counts = np.bincount(codes)
+        counts = counts[counts > 0]
 
         # Calculate entropy-like measure of balance
-        total = sum(type_counts.values())
-        entropy = -sum(
-            (count / total) * math.log2(count / total) for count in type_counts.values()
-        )
-        max_entropy = math.log2(len(type_counts))
+        probs = counts / codes.size
+        entropy = float(-(probs * np.log2(probs)).sum())
+        max_entropy = math.log2(counts.size)
 
         return entropy / max_entropy if max_entropy > 0 else 1.0
 
-    def _analyze_structure_patterns(self, obj: Any, patterns: Dict, level: int):
+    def _analyze_structure_patterns(
+        self, obj: Any, patterns: Dict[str, int], level: int
+    ) -> None:
         """Analyze structural patterns at different levels"""
-        if isinstance(obj, dict):
-            pattern_key = f"dict_level_{level}_keys_{len(obj)}"
-            patterns[pattern_key] = patterns.get(pattern_key, 0) + 1
-
-            for value in obj.values():
-                self._analyze_structure_patterns(value, patterns, level + 1)
-        elif isinstance(obj, list):
-            pattern_key = f"list_level_{level}_items_{len(obj)}"
-            patterns[pattern_key] = patterns.get(pattern_key, 0) + 1
-
-            for item in obj:
-                self._analyze_structure_patterns(item, patterns, level + 1)
+        tree = _walk_tree(obj, level)
+        for (is_list, node_level, size), count in tree["structure_patterns"].items():
+            if is_list:
+                pattern_key = f"list_level_{node_level}_items_{size}"
+            else:
+                pattern_key = f"dict_level_{node_level}_keys_{size}"
+            patterns[pattern_key] = patterns.get(pattern_key, 0) + count
 
-    def _count_nesting_levels(self, obj: Any, level_counts: Dict, level: int):
+    def _count_nesting_levels(
+        self, obj: Any, level_counts: Dict[int, int], level: int
+    ) -> None:
         """Count elements at each nesting level"""
-        level_counts[level] = level_counts.get(level, 0) + 1
-
-        if isinstance(obj, dict):
-            for value in obj.values():
-                self._count_nesting_levels(value, level_counts, level + 1)
-        elif isinstance(obj, list):
-            for item in obj:
-                self._count_nesting_levels(item, level_counts, level + 1)
-
-    def _count_elements_by_scale(self, obj: Any, scale_counts: Dict, scale: int):
+        tree = _walk_tree(obj, level)
+        for node_level in range(level, len(tree["level_counts"])):
+            count = tree["level_counts"][node_level]
+            level_counts[node_level] = level_counts.get(node_level, 0) + count
+
+    def _count_elements_by_scale(
+        self, obj: Any, scale_counts: Dict[int, int], scale: int
+    ) -> None:
         """Count elements at different scales for fractal dimension calculation"""
-        scale_counts[scale] = scale_counts.get(scale, 0) + 1
-
-        if isinstance(obj, dict) and obj:
-            for value in obj.values():
-                self._count_elements_by_scale(value, scale_counts, scale * 2)
-        elif isinstance(obj, list) and obj:
-            for item in obj:
-                self._count_elements_by_scale(item, scale_counts, scale * 2)
+        # Scale doubles with each nesting level below obj
+        for node_level, count in enumerate(_walk_tree(obj)["level_counts"]):
+            node_scale = scale * 2**node_level
+            scale_counts[node_scale] = scale_counts.get(node_scale, 0) + count
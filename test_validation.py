@@ -4,28 +4,90 @@
 Final validation and summary of comprehensive testing implementation
 """
 
+import ast
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-
-def check_file_exists(file_path, description=""):
-    """Check if a file exists and report status"""
-    exists = os.path.exists(file_path)
-    status = "✅" if exists else "❌"
-    print(f"{status} {description}: {file_path}")
-    return exists
-
-
-def count_test_functions(file_path):
+# Files the report expects, as (directory, file name, description) rows
+STRUCTURE_CHECKS = (
+    ("src", "database_manager.py", "Database Manager Source"),
+    ("src", "monitoring_integration.py", "Monitoring Integration Source"),
+    ("src", "aar_generator.py", "AAR Generator Source"),
+    ("src", "sacred_geometry_engine.py", "Sacred Geometry Engine Source"),
+    ("src", "compliance_checker.py", "Compliance Checker Source"),
+    ("src", "aar_processor.py", "AAR Processor Source"),
+    ("tests", "conftest.py", "Test Configuration"),
+    ("tests", "test_database_manager.py", "Database Manager Tests"),
+    ("tests", "test_monitoring_integration.py", "Monitoring Integration Tests"),
+    ("tests", "test_aar_generator.py", "AAR Generator Tests"),
+    ("tests", "test_sacred_geometry_engine.py", "Sacred Geometry Engine Tests"),
+    ("tests", "test_compliance_checker.py", "Compliance Checker Tests"),
+    ("tests", "test_aar_processor.py", "AAR Processor Tests"),
+    ("tests", "test_integration.py", "Integration Tests"),
+    ("tests", "pytest.ini", "Pytest Configuration"),
+    ("tests", "requirements-test.txt", "Test Requirements"),
+    ("tests", "README.md", "Test Documentation"),
+    ("tests", "TEST_SUMMARY.md", "Test Summary"),
+    (".", "run_tests.py", "Test Runner Script"),
+)
+
+# Test modules under tests/ whose test functions are counted
+TEST_FILES = (
+    ("test_database_manager.py", "Database Manager"),
+    ("test_monitoring_integration.py", "Monitoring Integration"),
+    ("test_aar_generator.py", "AAR Generator"),
+    ("test_sacred_geometry_engine.py", "Sacred Geometry Engine"),
+    ("test_compliance_checker.py", "Compliance Checker"),
+    ("test_aar_processor.py", "AAR Processor"),
+    ("test_integration.py", "Integration Tests"),
+)
+
+
+def scan_present(*directories):
+    """List each directory once, returning the set of paths found in them"""
+    present = set()
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                present.update(Path(directory) / entry.name for entry in entries)
+        except FileNotFoundError:
+            continue
+    return present
+
+
+@lru_cache(maxsize=None)
+def _count_tests_in(file_path):
+    """Count ``test_*`` function definitions, memoized per path
+
+    Parsing skips mentions of ``def test_`` inside strings and comments;
+    files that do not parse fall back to a raw substring count.
+    """
+    source = Path(file_path).read_bytes()
+    try:
+        tree = ast.parse(source, filename=str(file_path))
+    except SyntaxError:
+        return source.count(b"def test_")
+    return sum(
+        1
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        and node.name.startswith("test_")
+    )
+
+
+def count_test_functions(file_path, present=None):
     """Count test functions in a test file"""
-    if not os.path.exists(file_path):
+    if present is not None and Path(file_path) not in present:
         return 0
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        return content.count("def test_")
+    # Opening the file doubles as the existence check
+    try:
+        return _count_tests_in(Path(file_path))
+    except FileNotFoundError:
+        return 0
 
 
 def main():
@@ -39,36 +101,19 @@ def main():
     print("📁 PROJECT STRUCTURE VALIDATION")
     print("-" * 40)
 
-    base_path = Path(".")
-    src_path = base_path / "src"
-    tests_path = base_path / "tests"
-
-    structure_checks = [
-        (src_path / "database_manager.py", "Database Manager Source"),
-        (src_path / "monitoring_integration.py", "Monitoring Integration Source"),
-        (src_path / "aar_generator.py", "AAR Generator Source"),
-        (src_path / "sacred_geometry_engine.py", "Sacred Geometry Engine Source"),
-        (src_path / "compliance_checker.py", "Compliance Checker Source"),
-        (src_path / "aar_processor.py", "AAR Processor Source"),
-        (tests_path / "conftest.py", "Test Configuration"),
-        (tests_path / "test_database_manager.py", "Database Manager Tests"),
-        (tests_path / "test_monitoring_integration.py", "Monitoring Integration Tests"),
-        (tests_path / "test_aar_generator.py", "AAR Generator Tests"),
-        (tests_path / "test_sacred_geometry_engine.py", "Sacred Geometry Engine Tests"),
-        (tests_path / "test_compliance_checker.py", "Compliance Checker Tests"),
-        (tests_path / "test_aar_processor.py", "AAR Processor Tests"),
-        (tests_path / "test_integration.py", "Integration Tests"),
-        (tests_path / "pytest.ini", "Pytest Configuration"),
-        (tests_path / "requirements-test.txt", "Test Requirements"),
-        (tests_path / "README.md", "Test Documentation"),
-        (tests_path / "TEST_SUMMARY.md", "Test Summary"),
-        (Path("run_tests.py"), "Test Runner Script"),
-    ]
+    tests_path = Path("tests")
+    present = scan_present(*{directory for directory, _, _ in STRUCTURE_CHECKS})
 
-    all_files_exist = True
-    for file_path, description in structure_checks:
-        if not check_file_exists(file_path, description):
-            all_files_exist = False
+    # One set difference answers every existence check
+    wanted = {Path(directory) / name for directory, name, _ in STRUCTURE_CHECKS}
+    missing = wanted - present
+
+    for directory, name, description in STRUCTURE_CHECKS:
+        file_path = Path(directory) / name
+        status = "❌" if file_path in missing else "✅"
+        print(f"{status} {description}: {file_path}")
+
+    all_files_exist = not missing
 
     print()
 
@@ -76,19 +121,9 @@ def main():
     print("🧪 TEST FUNCTION ANALYSIS")
     print("-" * 40)
 
-    test_files = [
-        (tests_path / "test_database_manager.py", "Database Manager"),
-        (tests_path / "test_monitoring_integration.py", "Monitoring Integration"),
-        (tests_path / "test_aar_generator.py", "AAR Generator"),
-        (tests_path / "test_sacred_geometry_engine.py", "Sacred Geometry Engine"),
-        (tests_path / "test_compliance_checker.py", "Compliance Checker"),
-        (tests_path / "test_aar_processor.py", "AAR Processor"),
-        (tests_path / "test_integration.py", "Integration Tests"),
-    ]
-
     total_tests = 0
-    for test_file, description in test_files:
-        test_count = count_test_functions(test_file)
+    for name, description in TEST_FILES:
+        test_count = count_test_functions(tests_path / name, present)
         total_tests += test_count
         print(f"📊 {description}: {test_count} test functions")
 
@@ -180,7 +215,7 @@ def main():
     print("🎉 IMPLEMENTATION SUMMARY")
     print("=" * 70)
 
-    print(f"📊 Total Test Files: {len(test_files)}")
+    print(f"📊 Total Test Files: {len(TEST_FILES)}")
     print(f"🧪 Total Test Functions: {total_tests}")
     print(f"📁 All Required Files: {'✅ Present' if all_files_exist else '❌ Missing'}")
     print("🌀 Sacred Geometry Integration: ✅ Complete")
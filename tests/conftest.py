@@ -4,77 +4,193 @@ Pytest configuration and shared test fixtures for AAR processor tests
 """
 
 import asyncio
-import os
+import json
+import sqlite3
 import tempfile
-from typing import Generator
+import uuid
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Dict, Generator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 import structlog
 
-# Configure structured logging for tests
+# Tests assert on behaviour, never on log output, so log calls are
+# swallowed: no processors, no rendering and no stdlib handlers
 structlog.configure(
-    processors=[structlog.stdlib.filter_by_level, structlog.dev.ConsoleRenderer()],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
+    processors=[],
+    wrapper_class=structlog.BoundLogger,
+    logger_factory=structlog.ReturnLoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
 
+def _memory_db_uri() -> str:
+    """URI of a fresh in-memory SQLite database
+
+    Each call names a distinct database, which lives until its last
+    connection closes, so tests never share data or touch the disk.
+    """
+    return f"file:aar_test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+# Test data is disposable, so trade durability for fewer syncs. WAL only
+# takes effect on file-backed databases; memory databases keep their own
+# journal and just ignore it. Automatic checkpoints are off so none stalls
+# a test midway; the session checkpoints once at teardown instead.
+_SQLITE_TEST_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA wal_autocheckpoint=0;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-64000;
+"""
+
+
+def _tune_sqlite(connection: sqlite3.Connection) -> None:
+    """Apply the fast, non-durable test PRAGMAs to an open connection"""
+    connection.executescript(_SQLITE_TEST_PRAGMAS)
+
+
+@pytest.fixture(scope="session")
+def temp_base_dir() -> Generator[Path, None, None]:
+    """Session-wide scratch directory, removed with everything in it at exit"""
+    with tempfile.TemporaryDirectory(prefix="aar_tests_") as base_dir:
+        yield Path(base_dir)
+
+
 @pytest.fixture
 def temp_db_path() -> Generator[str, None, None]:
-    """Create a temporary database file for testing"""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-        temp_path = temp_file.name
+    """Provide an in-memory database URI for testing"""
+    yield _memory_db_uri()
+
 
-    yield temp_path
+@pytest.fixture
+def temp_db_file(temp_base_dir: Path) -> str:
+    """Path of a not-yet-created database file for tests that need one on disk"""
+    return str(temp_base_dir / f"{uuid.uuid4().hex}.db")
 
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
 
+@pytest.fixture(scope="session")
+def db_schema_cache(event_loop) -> Generator[sqlite3.Connection, None, None]:
+    """Empty in-memory database holding the schema, built once per session
 
-@pytest.fixture
-async def database_manager():
-    """Create a database manager instance for testing"""
+    The DDL comes from ``DatabaseManager.initialize()`` so the template
+    can never drift from the real schema. Copy it into a connection with
+    ``db_schema_cache.backup(target)`` to get a pristine database.
+    """
     from src.database_manager import DatabaseManager
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-        temp_path = temp_file.name
+    template = DatabaseManager(db_path=":memory:")
+    event_loop.run_until_complete(template.initialize())
+
+    yield template.connection
 
-    db_manager = DatabaseManager(db_path=temp_path)
-    await db_manager.initialize()
+    event_loop.run_until_complete(template.close())
+
+
+@pytest.fixture(scope="session")
+def _session_database_manager(event_loop):
+    """One initialized in-memory database manager shared by the session
+
+    The schema is created once; tests are isolated by restoring the
+    schema template over it in ``database_manager``.
+    """
+    from src.database_manager import DatabaseManager
+
+    db_manager = DatabaseManager(db_path=_memory_db_uri())
+    event_loop.run_until_complete(db_manager.initialize())
+    _tune_sqlite(db_manager.connection)
 
     yield db_manager
 
-    await db_manager.close()
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    db_manager.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    event_loop.run_until_complete(db_manager.close())
+
+
+@pytest.fixture
+async def database_manager(_session_database_manager, db_schema_cache):
+    """Provide the shared database manager with empty tables and caches"""
+    db_manager = _session_database_manager
+    # Page-level copy of the empty schema: drops rows, AUTOINCREMENT
+    # counters and anything a test altered, without re-running DDL
+    db_schema_cache.backup(db_manager.connection)
+    db_manager._status_cache.clear()
+    db_manager._report_cache.clear()
+
+    yield db_manager
+
+    # Flush queued writes so nothing lands after the next test resets
+    await db_manager._stop_writer()
+
+
+# Shared by every AAR the factory builds; storage only serializes these,
+# so tests must not mutate them. MappingProxyType would enforce that but
+# json.dumps cannot serialize it.
+_EMPTY_REPORT: Dict[str, Any] = {}
+_EMPTY_METADATA: Dict[str, Any] = {}
+
+
+@pytest.fixture(scope="session")
+def make_aar() -> Callable[..., Any]:
+    """Factory for minimal AARResults named ``test-<kind>-<idx>``"""
+    from src.aar_generator import AARResult
+
+    def _make_aar(idx, score: float = 0.8, kind: str = "aar"):
+        return AARResult(
+            aar_id=f"test-{kind}-{idx}",
+            mission_id=f"mission-{kind}-{idx}",
+            compliance_score=score,
+            report_content=_EMPTY_REPORT,
+            metadata=_EMPTY_METADATA,
+        )
+
+    return _make_aar
+
+
+_CANNED_CLUSTER_HEALTH = MappingProxyType(
+    {"status": "green", "cluster_name": "test-cluster", "number_of_nodes": 1}
+)
+
+
+class _FakeResponse:
+    """Plain stand-in for an aiohttp response used as ``async with`` target
+
+    Tests adjust ``status`` directly; the body is always the canned
+    cluster health document.
+    """
+
+    def __init__(self, status: int = 200):
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def json(self, loads=json.loads):
+        return dict(_CANNED_CLUSTER_HEALTH)
+
+    async def read(self) -> bytes:
+        return json.dumps(dict(_CANNED_CLUSTER_HEALTH)).encode()
 
 
 @pytest.fixture
 def mock_aiohttp_session():
     """Mock aiohttp session for testing monitoring integration"""
-    session = MagicMock()
-
-    # Mock response object
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(
-        return_value={
-            "status": "green",
-            "cluster_name": "test-cluster",
-            "number_of_nodes": 1,
-        }
+    response = _FakeResponse()
+
+    # aiohttp's get/post return async context managers, not coroutines;
+    # they stay mocks so tests can inspect calls and set side effects
+    return SimpleNamespace(
+        get=MagicMock(return_value=response),
+        post=MagicMock(return_value=response),
+        close=AsyncMock(),
     )
-    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_response.__aexit__ = AsyncMock(return_value=None)
-
-    session.get = AsyncMock(return_value=mock_response)
-    session.post = AsyncMock(return_value=mock_response)
-    session.close = AsyncMock()
-
-    return session
 
 
 @pytest.fixture
@@ -93,26 +209,33 @@ async def monitoring_integration(mock_aiohttp_session):
 
 @pytest.fixture
 def sacred_geometry_engine():
-    """Create Sacred Geometry engine for testing"""
+    """Create Sacred Geometry engine for testing
+
+    Kept per test: ``initialize()`` sets state, tests replace entries in
+    ``patterns``, and ``validate_data`` caches results.
+    """
     from src.sacred_geometry_engine import SacredGeometryEngine
 
     return SacredGeometryEngine()
 
 
 @pytest.fixture
-async def aar_generator(sacred_geometry_engine):
-    """Create AAR generator for testing"""
+def aar_generator(sacred_geometry_engine):
+    """Create AAR generator for testing, on the per-test engine"""
     from src.aar_generator import AARGenerator
 
     return AARGenerator(sacred_geometry_engine)
 
 
 @pytest.fixture
-def compliance_checker():
-    """Create compliance checker for testing"""
+def compliance_checker(sacred_geometry_engine):
+    """Create compliance checker for testing
+
+    Kept per test: ``update_compliance`` mutates the checker.
+    """
     from src.compliance_checker import ComplianceChecker
 
-    return ComplianceChecker()
+    return ComplianceChecker(sacred_geometry_engine)
 
 
 @pytest.fixture
@@ -180,9 +303,137 @@ def mock_prometheus_metrics():
     }
 
 
+@pytest.fixture(scope="session")
+def spec_mock() -> Callable[[type], MagicMock]:
+    """Factory for ``MagicMock(spec=cls)``, built once per class per session
+
+    Building a spec'd mock walks every attribute of the class. The cached
+    mock is reset (calls, return values and side effects) each time it is
+    handed out, so asking twice within one test returns the same object.
+    """
+    mocks: Dict[type, MagicMock] = {}
+
+    def _spec_mock(cls: type) -> MagicMock:
+        mock = mocks.get(cls)
+        if mock is None:
+            mock = mocks[cls] = MagicMock(spec=cls)
+        else:
+            mock.reset_mock(return_value=True, side_effect=True)
+        return mock
+
+    return _spec_mock
+
+
+@pytest.fixture(scope="session")
+def client():
+    """FastAPI test client shared by the session, without lifespan startup
+
+    Routing, middleware and instrumentation are wired once. The client
+    holds no per-test state: components live on ``app.state`` and are
+    seeded per test by ``app_components``, and dependency overrides are
+    cleared by ``_reset_app_overrides``, so sharing is safe.
+    """
+    from fastapi.testclient import TestClient
+
+    from src.aar_processor import app
+
+    return TestClient(app)
+
+
+def _stub_app_components() -> Dict[str, SimpleNamespace]:
+    """Fresh stand-ins for the components the app lifespan puts on app.state
+
+    The real lifespan cannot start under test, so endpoint tests run
+    against these; every method is a mock a test can reconfigure.
+    """
+    from src.aar_generator import AARResult
+
+    async def _generate(aar_id, mission_id, **kwargs):
+        return AARResult(
+            aar_id=aar_id,
+            mission_id=mission_id,
+            compliance_score=0.85,
+            report_content={"status": "success"},
+            metadata={"version": "1.0"},
+        )
+
+    return {
+        "sacred_geometry": SimpleNamespace(
+            is_healthy=MagicMock(return_value=True),
+            validate_patterns=MagicMock(return_value=True),
+            generate_aar_id=MagicMock(
+                side_effect=lambda mission_id: f"aar_{uuid.uuid4().hex}"
+            ),
+            validate_data=AsyncMock(return_value={"overall_compliance": 0.85}),
+        ),
+        "aar_generator": SimpleNamespace(generate=AsyncMock(side_effect=_generate)),
+        "monitoring": SimpleNamespace(
+            is_connected=MagicMock(return_value=True),
+            send_aar_metrics=AsyncMock(),
+        ),
+        "database": SimpleNamespace(
+            is_healthy=AsyncMock(return_value=True),
+            store_aar=AsyncMock(return_value=True),
+            get_aar_status=AsyncMock(return_value=None),
+            get_aar_status_fast=AsyncMock(return_value=None),
+            get_aar_report=AsyncMock(return_value=None),
+        ),
+        "compliance": SimpleNamespace(
+            get_current_compliance=AsyncMock(return_value=0.85),
+            get_detailed_compliance=AsyncMock(
+                return_value={"current_score": 0.85, "compliance_level": "good"}
+            ),
+        ),
+    }
+
+
 @pytest.fixture
-async def test_client():
-    """Create FastAPI test client"""
+def app_components() -> Generator[Dict[str, SimpleNamespace], None, None]:
+    """Seed the app's state with stub components for one test
+
+    The components are removed again afterwards, so tests on the
+    unseeded ``client`` never see them.
+    """
+    from src.aar_processor import app
+
+    components = _stub_app_components()
+    for name, component in components.items():
+        setattr(app.state, name, component)
+
+    yield components
+
+    for name in components:
+        delattr(app.state, name)
+
+
+@pytest.fixture(autouse=True)
+def _seed_app_state(request):
+    """Give every ``async_client`` test a seeded app state"""
+    if "async_client" in request.fixturenames:
+        request.getfixturevalue("app_components")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Async ASGI client shared by the session, without lifespan startup
+
+    Requests run on the test event loop itself instead of going through
+    TestClient's portal thread. The lifespan cannot start here, so each
+    test using this client gets ``app_components`` on ``app.state``.
+    """
+    from httpx import ASGITransport, AsyncClient
+
+    from src.aar_processor import app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def test_client():
+    """FastAPI test client whose app lifespan runs once per session"""
     from fastapi.testclient import TestClient
 
     from src.aar_processor import app
@@ -191,9 +442,19 @@ async def test_client():
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_app_overrides(request):
+    """Drop dependency overrides a test left on the shared app"""
+    yield
+    if not {"client", "async_client", "test_client"}.isdisjoint(request.fixturenames):
+        from src.aar_processor import app
+
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
 def event_loop():
-    """Create event loop for async tests"""
+    """Create one event loop shared by every async test in the session"""
     loop = asyncio.new_event_loop()
     yield loop
     loop.close()
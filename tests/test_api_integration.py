@@ -3,21 +3,28 @@
 Tests the FastAPI endpoints and complete workflows
 """
 
+import asyncio
+import time
+from types import MappingProxyType
+
 import pytest
-from fastapi.testclient import TestClient
 
-# Import the FastAPI app
-from src.aar_processor import app
+# Request body for tests that only care about the mission, not its content
+_AAR_TEMPLATE = MappingProxyType(
+    {
+        "start_time": "2025-06-18T23:00:00Z",
+        "end_time": "2025-06-18T23:15:00Z",
+        "participants": ["test_user"],
+        "objectives": ["Test AAR endpoints"],
+        "outcomes": ["Request processed"],
+        "lessons_learned": ["AAR endpoints work well"],
+    }
+)
 
 
 class TestAARProcessorAPI:
     """Integration tests for the AAR Processor FastAPI application"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client for FastAPI app"""
-        return TestClient(app)
-
     def test_health_endpoint(self, client):
         """Test the health check endpoint"""
         response = client.get("/health")
@@ -28,9 +35,7 @@ class TestAARProcessorAPI:
         assert "timestamp" in data
         assert "version" in data
         assert "sacred_geometry" in data
-        assert data["sacred_geometry"]["phi"] == pytest.approx(
-            PHI, rel=1e-10
-        )
+        assert data["sacred_geometry"]["phi"] == pytest.approx(PHI, rel=1e-10)
 
     def test_generate_aar_endpoint(self, client):
         """Test AAR generation endpoint"""
@@ -64,14 +69,9 @@ class TestAARProcessorAPI:
         """Test AAR status retrieval endpoint"""
         # First create an AAR
         aar_request = {
+            **_AAR_TEMPLATE,
             "mission_id": "status_test_001",
             "mission_type": "status_check",
-            "start_time": "2025-06-18T23:00:00Z",
-            "end_time": "2025-06-18T23:15:00Z",
-            "participants": ["test_user"],
-            "objectives": ["Test status endpoint"],
-            "outcomes": ["Status retrieved successfully"],
-            "lessons_learned": ["Status endpoints work well"],
         }
 
         # Generate AAR
@@ -79,13 +79,12 @@ class TestAARProcessorAPI:
         assert gen_response.status_code == 200
         aar_id = gen_response.json()["aar_id"]
 
-        # Give it a moment to process (in real implementation, this would be async)
-        import time
-
-        time.sleep(0.1)
-
-        # Check status
+        # Poll until the AAR is stored, for at most 200 ms
+        deadline = time.monotonic() + 0.2
         status_response = client.get(f"/aar/{aar_id}/status")
+        while status_response.status_code == 404 and time.monotonic() < deadline:
+            time.sleep(0.002)
+            status_response = client.get(f"/aar/{aar_id}/status")
 
         # Could be 200 (found) or 404 (not found yet), both are valid for async processing
         if status_response.status_code == 200:
@@ -158,53 +157,41 @@ class TestAARProcessorAPI:
         response = client.post("/aar/generate", json=invalid_request)
         assert response.status_code == 422
 
-    def test_concurrent_requests(self, client):
+    @pytest.mark.asyncio
+    async def test_concurrent_requests(self, app_components, async_client):
         """Test handling of concurrent AAR requests"""
-        import threading
-
-        results = []
-
-        def make_request(i):
-            aar_request = {
-                "mission_id": f"concurrent_test_{i}",
-                "mission_type": "concurrency_test",
-                "start_time": "2025-06-18T23:00:00Z",
-                "end_time": "2025-06-18T23:15:00Z",
-                "participants": [f"user_{i}"],
-                "objectives": [f"Concurrent test {i}"],
-                "outcomes": [f"Request {i} processed"],
-                "lessons_learned": [f"Concurrency test {i} completed"],
-            }
-
-            response = client.post("/aar/generate", json=aar_request)
-            results.append((i, response.status_code, response.json()))
-
-        # Create multiple threads
-        threads = []
-        for i in range(5):
-            t = threading.Thread(target=make_request, args=(i,))
-            threads.append(t)
-            t.start()
-
-        # Wait for all threads to complete
-        for t in threads:
-            t.join()
+        # Overlap the requests on the event loop; async_client runs against
+        # the stub components seeded on app.state
+        responses = await asyncio.gather(
+            *(
+                async_client.post(
+                    "/aar/generate",
+                    json={
+                        "mission_id": f"concurrent_test_{i}",
+                        "mission_type": "concurrency_test",
+                        "context_data": dict(_AAR_TEMPLATE),
+                    },
+                )
+                for i in range(5)
+            )
+        )
 
         # Verify all requests succeeded
-        assert len(results) == 5
-        for i, status_code, data in results:
-            assert status_code == 200, f"Request {i} failed with status {status_code}"
-            assert "aar_id" in data
+        assert len(responses) == 5
+        for i, response in enumerate(responses):
+            assert (
+                response.status_code == 200
+            ), f"Request {i} failed with status {response.status_code}"
+            assert response.json()["mission_id"] == f"concurrent_test_{i}"
+
+        # Every request got its own AAR and was stored
+        assert len({r.json()["aar_id"] for r in responses}) == 5
+        assert app_components["database"].store_aar.await_count == 5
 
 
 class TestIntegrationWorkflows:
     """Integration tests for complete workflows"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client for FastAPI app"""
-        return TestClient(app)
-
     def test_complete_aar_workflow(self, client):
         """Test complete AAR processing workflow through API"""
         # Step 1: Generate AAR
@@ -4,22 +4,26 @@
 Comprehensive testing for the Sacred Geometry compliance monitoring system
 """
 
+import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
 from src.compliance_checker import ComplianceChecker
-from src.sacred_geometry_engine import SacredGeometryEngine
 
 
 class TestComplianceChecker:
     """Test Compliance Checker functionality"""
 
-    @pytest.fixture
-    def mock_sacred_geometry(self):
-        """Mock Sacred Geometry engine"""
-        engine = MagicMock(spec=SacredGeometryEngine)
+    @staticmethod
+    def _stock_engine(engine):
+        """Give the engine stub fresh AsyncMocks with default returns
+
+        A plain namespace carrying only the three methods the checker
+        tests touch, so there is no spec introspection to pay for.
+        """
         engine.calculate_compliance = AsyncMock(return_value=0.85)
         engine.validate_pattern = AsyncMock(return_value=True)
         engine.get_geometry_insights = AsyncMock(
@@ -36,11 +40,21 @@ class TestComplianceChecker:
         )
         return engine
 
+    @pytest.fixture(scope="class")
+    def mock_sacred_geometry(self):
+        """Stub Sacred Geometry engine shared by the class"""
+        return self._stock_engine(SimpleNamespace())
+
     @pytest.fixture
     def compliance_checker(self, mock_sacred_geometry):
         """Create Compliance Checker instance"""
         return ComplianceChecker(mock_sacred_geometry)
 
+    @pytest.fixture(autouse=True)
+    def _reset(self, mock_sacred_geometry):
+        """Give the shared engine stub fresh mocks for each test"""
+        self._stock_engine(mock_sacred_geometry)
+
     def test_compliance_checker_initialization(self, mock_sacred_geometry):
         """Test compliance checker initialization"""
         checker = ComplianceChecker(mock_sacred_geometry)
@@ -107,6 +121,22 @@ class TestComplianceChecker:
         assert compliance_checker.last_check is not None
         assert before_update <= compliance_checker.last_check <= after_update
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_compliance(self, compliance_checker):
+        """Test a batch of scores leaves the last one current"""
+        before_update = datetime.now()
+
+        await compliance_checker.bulk_update_compliance([0.5, 0.7, 0.85])
+
+        assert compliance_checker.current_compliance == 0.85
+        assert before_update <= compliance_checker.last_check <= datetime.now()
+
+        # An empty batch changes nothing
+        last_check = compliance_checker.last_check
+        await compliance_checker.bulk_update_compliance([])
+        assert compliance_checker.current_compliance == 0.85
+        assert compliance_checker.last_check == last_check
+
     @pytest.mark.asyncio
     async def test_update_compliance_boundary_values(self, compliance_checker):
         """Test updating compliance with boundary values"""
@@ -244,8 +274,7 @@ class TestComplianceChecker:
         """Test compliance history tracking"""
         scores = [0.5, 0.7, 0.85, 0.9, 0.88]
 
-        for score in scores:
-            await compliance_checker.update_compliance(score)
+        await compliance_checker.bulk_update_compliance(scores)
 
         history = await compliance_checker.get_compliance_history()
 
@@ -261,8 +290,7 @@ class TestComplianceChecker:
         # Simulate improving trend
         improving_scores = [0.5, 0.6, 0.7, 0.8, 0.85]
 
-        for score in improving_scores:
-            await compliance_checker.update_compliance(score)
+        await compliance_checker.bulk_update_compliance(improving_scores)
 
         trend = await compliance_checker.analyze_compliance_trend()
 
@@ -315,8 +343,6 @@ class TestComplianceChecker:
         self, compliance_checker, mock_sacred_geometry
     ):
         """Test continuous compliance monitoring"""
-        import asyncio
-
         # Start monitoring
         monitoring_task = asyncio.create_task(
             compliance_checker.start_continuous_monitoring(interval=0.1)
@@ -395,8 +421,6 @@ class TestComplianceChecker:
         self, compliance_checker, mock_sacred_geometry
     ):
         """Test concurrent compliance checking"""
-        import asyncio
-
         test_datasets = [{"id": i, "performance": 0.8 + (i * 0.02)} for i in range(5)]
 
         # Configure mock to return different scores
@@ -204,6 +204,39 @@ class TestComplianceCheckerAsyncCorrect:
         pattern_validation = checker.sacred_geometry.validate_patterns(valid_patterns)
         assert isinstance(pattern_validation, bool)
 
+    def test_compliance_recommendations_are_fresh_lists(self):
+        """Test recommendations come back as independent lists per call"""
+        engine = SacredGeometryEngine()
+        checker = ComplianceChecker(engine)
+
+        first = checker._get_compliance_recommendations("critical")
+        second = checker._get_compliance_recommendations("critical")
+        assert isinstance(first, list)
+        assert first == second
+        assert first is not second
+
+        first.append("caller mutation")
+        assert "caller mutation" not in checker._get_compliance_recommendations("critical")
+
+        fallback = checker._get_compliance_recommendations("unknown_level")
+        assert fallback == ["Contact system administrator"]
+
+    def test_classify_scores_matches_compliance_level(self):
+        """Test vectorized bucketing agrees with per-score level lookup"""
+        engine = SacredGeometryEngine()
+        checker = ComplianceChecker(engine)
+
+        scores = [0.0, 0.29, 0.3, 0.49, 0.5, 0.69, 0.7, 0.79, 0.8, 0.89, 0.9, 1.0]
+        distribution = checker.get_level_distribution(scores)
+
+        expected = {}
+        for score in scores:
+            level = checker._get_compliance_level(score)
+            expected[level] = expected.get(level, 0) + 1
+
+        assert {k: v for k, v in distribution.items() if v} == expected
+        assert sum(distribution.values()) == len(scores)
+
     async def test_compliance_alerts_structure(self):
         """Test that compliance alerts have expected structure"""
         engine = SacredGeometryEngine()
@@ -289,6 +322,8 @@ def run_sync_tests():
         ("test_required_methods_exist", test.test_required_methods_exist),
         ("test_private_methods_exist", test.test_private_methods_exist),
         ("test_compliance_integration_with_sacred_geometry", test.test_compliance_integration_with_sacred_geometry),
+        ("test_compliance_recommendations_are_fresh_lists", test.test_compliance_recommendations_are_fresh_lists),
+        ("test_classify_scores_matches_compliance_level", test.test_classify_scores_matches_compliance_level),
     ]
 
     passed = 0
@@ -3,8 +3,8 @@
 Comprehensive tests for AAR database operations and persistence
 """
 
+import asyncio
 import os
-import tempfile
 
 import pytest
 
@@ -14,40 +14,21 @@ from src.database_manager import DatabaseManager
 class TestDatabaseManager:
     """Test suite for DatabaseManager class"""
 
-    @pytest.fixture
-    async def temp_db_manager(self):
-        """Create a temporary database manager for testing"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-            temp_path = temp_file.name
-
-        db_manager = DatabaseManager(db_path=temp_path)
-        await db_manager.initialize()
-
-        yield db_manager
-
-        await db_manager.close()
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-
     @pytest.mark.asyncio
-    async def test_initialization_creates_database(self):
+    async def test_initialization_creates_database(self, temp_db_file):
         """Test that database initialization creates the database file"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-            temp_path = temp_file.name
-
         # Database file should not exist initially
-        assert not os.path.exists(temp_path)
+        assert not os.path.exists(temp_db_file)
 
-        db_manager = DatabaseManager(db_path=temp_path)
+        db_manager = DatabaseManager(db_path=temp_db_file)
         await db_manager.initialize()
 
         # Database file should exist after initialization
-        assert os.path.exists(temp_path)
+        assert os.path.exists(temp_db_file)
         assert db_manager.connection is not None
 
         # Cleanup
         await db_manager.close()
-        os.unlink(temp_path)
 
         await db_manager.close()
 
@@ -76,22 +57,15 @@ class TestDatabaseManager:
         assert is_healthy is True
 
     @pytest.mark.asyncio
-    async def test_health_check_closed_database(self):
+    async def test_health_check_closed_database(self, temp_db_file):
         """Test health check with closed database"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-            temp_path = temp_file.name
-
-        db_manager = DatabaseManager(db_path=temp_path)
+        db_manager = DatabaseManager(db_path=temp_db_file)
         await db_manager.initialize()
         await db_manager.close()
 
         is_healthy = await db_manager.is_healthy()
         assert is_healthy is False
 
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-
     @pytest.mark.asyncio
     async def test_store_aar_report(self, database_manager, sample_context_data):
         """Test storing AAR report in database"""
@@ -429,7 +403,6 @@ class TestDatabaseManager:
     @pytest.mark.asyncio
     async def test_concurrent_access(self, database_manager):
         """Test handling of concurrent database operations"""
-        import asyncio
 
         # Create multiple concurrent write operations
         async def store_report(report_id):
@@ -3,8 +3,9 @@
 Comprehensive tests for AAR database operations and persistence
 """
 
+import asyncio
 import os
-import tempfile
+import sqlite3
 
 import pytest
 
@@ -16,39 +17,25 @@ class TestDatabaseManager:
     """Test suite for DatabaseManager class"""
 
     @pytest.fixture
-    async def temp_db_manager(self):
-        """Create a temporary database manager for testing"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-            temp_path = temp_file.name
-
-        db_manager = DatabaseManager(db_path=temp_path)
-        await db_manager.initialize()
-
-        yield db_manager
-
-        await db_manager.close()
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    async def temp_db_manager(self, database_manager):
+        """Create an in-memory database manager for testing"""
+        yield database_manager
 
     @pytest.mark.asyncio
-    async def test_initialization_creates_database(self):
+    async def test_initialization_creates_database(self, temp_db_file):
         """Test that database initialization creates the database file"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-            temp_path = temp_file.name
-
         # Database file should not exist initially
-        assert not os.path.exists(temp_path)
+        assert not os.path.exists(temp_db_file)
 
-        db_manager = DatabaseManager(db_path=temp_path)
+        db_manager = DatabaseManager(db_path=temp_db_file)
         await db_manager.initialize()
 
         # Database file should exist after initialization
-        assert os.path.exists(temp_path)
+        assert os.path.exists(temp_db_file)
         assert db_manager.connection is not None
 
         # Cleanup
         await db_manager.close()
-        os.unlink(temp_path)
 
     @pytest.mark.asyncio
     async def test_health_check(self, temp_db_manager):
@@ -56,6 +43,18 @@ class TestDatabaseManager:
         health = await temp_db_manager.is_healthy()
         assert health is True
 
+    @pytest.mark.asyncio
+    async def test_memory_uri_stays_off_disk(self, temp_db_path, tmp_path, monkeypatch):
+        """Test SQLite URI paths open in-memory databases without files"""
+        monkeypatch.chdir(tmp_path)
+        db_manager = DatabaseManager(db_path=temp_db_path)
+        await db_manager.initialize()
+
+        assert await db_manager.is_healthy() is True
+        assert list(tmp_path.iterdir()) == []
+
+        await db_manager.close()
+
     @pytest.mark.asyncio
     async def test_store_aar_success(self, temp_db_manager):
         """Test successful AAR storage"""
@@ -92,6 +91,24 @@ class TestDatabaseManager:
         assert status["compliance_score"] == 0.92
         assert status["status"] == "completed"
 
+    @pytest.mark.asyncio
+    async def test_get_aar_status_fast(self, temp_db_manager):
+        """Test retrieving only the AAR status column"""
+        aar_result = AARResult(
+            aar_id="test-status-fast-123",
+            mission_id="mission-status-fast-456",
+            compliance_score=0.9,
+            report_content={"status": "completed"},
+            metadata={"version": "1.0"},
+        )
+        await temp_db_manager.store_aar(aar_result)
+
+        status = await temp_db_manager.get_aar_status_fast("test-status-fast-123")
+        assert status == "completed"
+
+        missing = await temp_db_manager.get_aar_status_fast("nonexistent-123")
+        assert missing is None
+
     @pytest.mark.asyncio
     async def test_get_aar_report(self, temp_db_manager):
         """Test retrieving AAR report"""
@@ -114,18 +131,44 @@ class TestDatabaseManager:
         assert "metadata" in report
 
     @pytest.mark.asyncio
-    async def test_list_aars(self, temp_db_manager):
+    async def test_get_aar_report_is_cached(self, temp_db_manager):
+        """Test completed AAR reports are served from the in-process cache"""
+        aar_result = AARResult(
+            aar_id="test-cache-123",
+            mission_id="mission-cache-456",
+            compliance_score=0.88,
+            report_content={"analysis": "cached"},
+            metadata={"version": "1.0"},
+        )
+        await temp_db_manager.store_aar(aar_result)
+
+        first = await temp_db_manager.get_aar_report("test-cache-123")
+        first["report_content"]["analysis"] = "changed by caller"
+        second = await temp_db_manager.get_aar_report("test-cache-123")
+
+        assert first is not None
+        assert "test-cache-123" in temp_db_manager._report_cache
+        # Each caller gets its own copy; mutating one leaves the cache intact
+        assert second is not first
+        assert second["report_content"] == {"analysis": "cached"}
+
+        status = await temp_db_manager.get_aar_status("test-cache-123")
+        status["status"] = "changed by caller"
+        status = await temp_db_manager.get_aar_status("test-cache-123")
+        assert status["status"] == "completed"
+
+        # Missing AARs are not cached so a later store becomes visible
+        assert await temp_db_manager.get_aar_report("nonexistent-789") is None
+        assert "nonexistent-789" not in temp_db_manager._report_cache
+
+    @pytest.mark.asyncio
+    async def test_list_aars(self, temp_db_manager, make_aar):
         """Test listing AARs"""
-        # Store multiple AARs
-        for i in range(3):
-            aar_result = AARResult(
-                aar_id=f"test-list-{i}",
-                mission_id=f"mission-list-{i}",
-                compliance_score=0.8 + (i * 0.05),
-                report_content={"index": i},
-                metadata={"test": True},
-            )
-            await temp_db_manager.store_aar(aar_result)
+        # Store multiple AARs in one transaction
+        stored = await temp_db_manager.store_aars(
+            [make_aar(i, 0.8 + (i * 0.05), kind="list") for i in range(3)]
+        )
+        assert stored == [True] * 3
 
         # List AARs
         aars = await temp_db_manager.list_aars(limit=10)
@@ -138,19 +181,138 @@ class TestDatabaseManager:
             assert "compliance_score" in aar
 
     @pytest.mark.asyncio
-    async def test_get_compliance_stats(self, temp_db_manager):
-        """Test compliance statistics calculation"""
-        # Store AARs with different compliance scores
-        scores = [0.7, 0.8, 0.9, 0.95]
-        for i, score in enumerate(scores):
-            aar_result = AARResult(
-                aar_id=f"test-stats-{i}",
-                mission_id=f"mission-stats-{i}",
-                compliance_score=score,
+    async def test_concurrent_store_and_read(self, temp_db_manager):
+        """Test concurrent writes and reads share the connection safely"""
+        aar_results = [
+            AARResult(
+                aar_id=f"test-concurrent-{i}",
+                mission_id=f"mission-concurrent-{i}",
+                compliance_score=0.8,
+                report_content={"index": i},
+                metadata={},
+            )
+            for i in range(10)
+        ]
+
+        results = await asyncio.gather(
+            *(temp_db_manager.store_aar(aar) for aar in aar_results),
+            temp_db_manager.list_aars(limit=10),
+        )
+
+        assert all(results[:10])
+        aars = await temp_db_manager.list_aars(limit=20)
+        assert len(aars) == 10
+
+    @pytest.mark.asyncio
+    async def test_iter_aars_streams_in_batches(self, temp_db_manager, make_aar):
+        """Test streaming AARs across several fetch batches"""
+        # Concurrent stores land in the writer's queue together and share
+        # one group commit
+        stored = await asyncio.gather(
+            *(temp_db_manager.store_aar(make_aar(i, kind="iter")) for i in range(5))
+        )
+        assert all(stored)
+
+        streamed = [
+            aar async for aar in temp_db_manager.iter_aars(limit=10, batch_size=2)
+        ]
+        assert len(streamed) == 5
+        assert streamed == await temp_db_manager.list_aars(limit=10)
+
+        # Early exit leaves the connection usable
+        async for aar in temp_db_manager.iter_aars(limit=10, batch_size=2):
+            assert "aar_id" in aar
+            break
+        assert await temp_db_manager.is_healthy() is True
+
+    @pytest.mark.asyncio
+    async def test_iter_aars_raises_mid_stream_failure(
+        self, temp_db_manager, make_aar, monkeypatch
+    ):
+        """Test a failure after rows were streamed is raised, not truncated"""
+        stored = await temp_db_manager.store_aars(
+            [make_aar(i, kind="broken") for i in range(4)]
+        )
+        assert stored == [True] * 4
+
+        run_sync = temp_db_manager._run_sync
+        calls = 0
+
+        async def _fail_second_batch(func):
+            nonlocal calls
+            calls += 1
+            # Calls are the query, the first batch, then the second batch
+            if calls == 3:
+                raise sqlite3.OperationalError("disk I/O error")
+            return await run_sync(func)
+
+        monkeypatch.setattr(temp_db_manager, "_run_sync", _fail_second_batch)
+
+        streamed = []
+        with pytest.raises(sqlite3.OperationalError):
+            async for aar in temp_db_manager.iter_aars(limit=10, batch_size=2):
+                streamed.append(aar)
+        assert len(streamed) == 2
+
+    @pytest.mark.asyncio
+    async def test_batched_store_isolates_failed_rows(self, temp_db_manager):
+        """Test a duplicate AAR in a group commit fails without losing the others"""
+        aar_results = [
+            AARResult(
+                aar_id=aar_id,
+                mission_id="mission-batch",
+                compliance_score=0.8,
+                report_content={},
+                metadata={},
+            )
+            for aar_id in ("test-batch-1", "test-batch-dup", "test-batch-dup")
+        ]
+
+        results = await asyncio.gather(
+            *(temp_db_manager.store_aar(aar) for aar in aar_results)
+        )
+
+        assert sorted(results) == [False, True, True]
+        assert await temp_db_manager.get_aar_status("test-batch-1") is not None
+        assert await temp_db_manager.get_aar_status("test-batch-dup") is not None
+
+    @pytest.mark.asyncio
+    async def test_store_aars_reports_each_row(self, temp_db_manager):
+        """Test bulk storage flags a failing row without losing the others"""
+        aar_results = [
+            AARResult(
+                aar_id=aar_id,
+                mission_id="mission-bulk",
+                compliance_score=0.9,
                 report_content={},
                 metadata={},
             )
-            await temp_db_manager.store_aar(aar_result)
+            for aar_id in ["test-bulk-0", "test-bulk-1", "test-bulk-0"]
+        ]
+
+        stored = await temp_db_manager.store_aars(aar_results)
+
+        assert stored == [True, True, False]
+        aars = await temp_db_manager.list_aars(limit=10)
+        assert sorted(aar["aar_id"] for aar in aars) == ["test-bulk-0", "test-bulk-1"]
+
+    @pytest.mark.asyncio
+    async def test_store_aars_without_connection(self):
+        """Test bulk storage fails every row when the database is closed"""
+        db_manager = DatabaseManager(db_path=":memory:")
+
+        assert await db_manager.store_aars([AARResult("a", "m", 0.5, {}, {})]) == [
+            False
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_compliance_stats(self, temp_db_manager, make_aar):
+        """Test compliance statistics calculation"""
+        # Store AARs with different compliance scores
+        scores = [0.7, 0.8, 0.9, 0.95]
+        await temp_db_manager.store_aars(
+            [make_aar(i, score, kind="stats") for i, score in enumerate(scores)]
+        )
 
         # Get compliance stats
         stats = await temp_db_manager.get_compliance_stats()
@@ -162,6 +324,50 @@ class TestDatabaseManager:
         assert isinstance(stats["total_aars"], int)
         assert stats["total_aars"] >= 4
 
+    @pytest.mark.asyncio
+    async def test_get_score_distribution(self, temp_db_manager, make_aar):
+        """Test percentile and histogram breakdown of compliance scores"""
+        empty = await temp_db_manager.get_score_distribution()
+        assert empty["total_aars"] == 0
+        assert empty["histogram"]["counts"] == []
+
+        scores = [25.0, 60.0, 75.0, 85.0, 95.0]
+        stored = await asyncio.gather(
+            *(
+                temp_db_manager.store_aar(make_aar(i, score, kind="dist"))
+                for i, score in enumerate(scores)
+            )
+        )
+        assert all(stored)
+
+        score_array = await temp_db_manager.get_score_array()
+        assert sorted(score_array.tolist()) == scores
+
+        distribution = await temp_db_manager.get_score_distribution()
+        assert distribution["total_aars"] == 5
+        assert distribution["percentiles"]["p50"] == pytest.approx(75.0)
+        assert distribution["histogram"]["counts"] == [1, 0, 1, 1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_compliance_stats_use_partial_index(self, temp_db_manager):
+        """Test compliance stats read the completed-score partial index"""
+        cursor = temp_db_manager.connection.cursor()
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'idx_completed_score'"
+        )
+        index_sql = cursor.fetchone()["sql"]
+        assert "WHERE status = 'completed'" in index_sql
+
+        cursor.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT AVG(compliance_score) FROM aars INDEXED BY idx_completed_score
+            WHERE status = 'completed'
+        """
+        )
+        plan = " ".join(row["detail"] for row in cursor.fetchall())
+        assert "COVERING INDEX idx_completed_score" in plan
+
     @pytest.mark.asyncio
     async def test_nonexistent_aar_status(self, temp_db_manager):
         """Test retrieving status for non-existent AAR"""
@@ -175,12 +381,9 @@ class TestDatabaseManager:
         assert report is None
 
     @pytest.mark.asyncio
-    async def test_database_close_and_cleanup(self):
+    async def test_database_close_and_cleanup(self, temp_db_file):
         """Test database closure and cleanup"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_file:
-            temp_path = temp_file.name
-
-        db_manager = DatabaseManager(db_path=temp_path)
+        db_manager = DatabaseManager(db_path=temp_db_file)
         await db_manager.initialize()
 
         # Verify connection exists
@@ -191,10 +394,67 @@ class TestDatabaseManager:
 
         # Verify connection is cleared
         assert db_manager.connection is None
+        assert db_manager._readers is None
 
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    @pytest.mark.asyncio
+    async def test_file_database_reads_from_reader_pool(self, temp_db_file, make_aar):
+        """Test on-disk reads run on pooled readers alongside the writer"""
+        db_manager = DatabaseManager(db_path=temp_db_file)
+        await db_manager.initialize()
+        try:
+            assert db_manager._readers is not None
+            mode = db_manager.connection.execute("PRAGMA journal_mode").fetchone()
+            assert mode[0] == "wal"
+
+            stored = await db_manager.store_aars([make_aar(i) for i in range(3)])
+            assert stored == [True] * 3
+            statuses, aars, stats = await asyncio.gather(
+                asyncio.gather(
+                    *(db_manager.get_aar_status(f"test-aar-{i}") for i in range(3))
+                ),
+                db_manager.list_aars(limit=10),
+                db_manager.get_compliance_stats(),
+            )
+
+            assert [status["aar_id"] for status in statuses] == [
+                f"test-aar-{i}" for i in range(3)
+            ]
+            assert len(aars) == 3
+            assert stats["total_aars"] == 3
+
+            # Readers are read-only connections
+            reader = await db_manager._acquire_reader()
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM aars")
+            db_manager._release_reader(reader)
+        finally:
+            await db_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_acquire_keeps_pool_size(self, temp_db_file):
+        """Test a reader taken for a cancelled acquire goes back to the pool"""
+        db_manager = DatabaseManager(db_path=temp_db_file)
+        await db_manager.initialize()
+        try:
+            held = [await db_manager._acquire_reader() for _ in range(4)]
+
+            # The acquire blocks in its worker thread until a reader frees up
+            waiter = asyncio.create_task(db_manager._acquire_reader())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+            for reader in held:
+                db_manager._release_reader(reader)
+
+            async def _pool_refilled():
+                while db_manager._readers.qsize() < 4:
+                    await asyncio.sleep(0.001)
+
+            await asyncio.wait_for(_pool_refilled(), timeout=1.0)
+        finally:
+            await db_manager.close()
 
     @pytest.mark.asyncio
     async def test_store_aar_with_sacred_geometry_patterns(self, temp_db_manager):
@@ -235,3 +495,30 @@ class TestDatabaseManager:
         except Exception as e:
             # Other errors should fail the test
             pytest.fail(f"Unexpected error in pattern trends retrieval: {e}")
+
+    @pytest.mark.asyncio
+    async def test_pattern_trends_use_denormalized_mission_id(self, temp_db_manager):
+        """Test pattern trends carry mission_id without joining aars"""
+        aar_result = AARResult(
+            aar_id="test-trend-123",
+            mission_id="mission-trend-456",
+            compliance_score=0.9,
+            report_content={},
+            metadata={},
+        )
+        await temp_db_manager.store_aar(aar_result)
+
+        stored = await temp_db_manager.store_sg_pattern_details(
+            "test-trend-123", {"circle": {"score": 0.8}, "spiral": {"score": 0.7}}
+        )
+        assert stored is True
+
+        trends = await temp_db_manager.get_pattern_trends("circle")
+        assert trends == [
+            {
+                "aar_id": "test-trend-123",
+                "mission_id": "mission-trend-456",
+                "pattern_score": 0.8,
+                "created_at": trends[0]["created_at"],
+            }
+        ]
@@ -3,6 +3,8 @@
 Comprehensive tests for monitoring and observability integration
 """
 
+import asyncio
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -63,6 +65,25 @@ class TestMonitoringIntegration:
             # Should still be marked as connected due to graceful error handling
             assert integration.connected is True
 
+    @pytest.mark.asyncio
+    async def test_connect_times_out_on_hung_backend(self):
+        """Test a backend that never answers cannot block connect"""
+
+        async def hang():
+            await asyncio.sleep(60)
+
+        with patch("src.monitoring_integration.aiohttp.ClientSession"), patch(
+            "src.monitoring_integration._CONNECT_TIMEOUT", 0.05
+        ), patch.object(
+            MonitoringIntegration, "_test_prometheus_connection", side_effect=hang
+        ), patch.object(
+            MonitoringIntegration, "_test_elasticsearch_connection", AsyncMock()
+        ):
+            integration = MonitoringIntegration()
+            await asyncio.wait_for(integration.connect(), timeout=1.0)
+
+        assert integration.connected is False
+
     @pytest.mark.asyncio
     async def test_disconnect(self, monitoring_integration):
         """Test disconnection from monitoring systems"""
@@ -93,8 +114,9 @@ class TestMonitoringIntegration:
             compliance_score=compliance_score,
             processing_duration=processing_duration,
         )
+        await monitoring_integration.flush()
 
-        # Verify session was used for both Elasticsearch and Prometheus
+        # Verify session was used for the Elasticsearch _bulk request
         assert monitoring_integration.session.post.call_count >= 1
 
     @pytest.mark.asyncio
@@ -110,6 +132,45 @@ class TestMonitoringIntegration:
         timestamp = health_data["timestamp"]
         datetime.fromisoformat(timestamp)  # Should not raise exception
 
+    @pytest.mark.asyncio
+    async def test_system_health_is_cached(self, monitoring_integration):
+        """Test concurrent and repeat health calls reuse one probe per backend"""
+        prometheus_check = AsyncMock(
+            return_value={"status": "healthy", "response_code": 200}
+        )
+        elasticsearch_check = AsyncMock(return_value={"status": "green"})
+
+        with patch.object(
+            MonitoringIntegration, "_check_prometheus_health", prometheus_check
+        ), patch.object(
+            MonitoringIntegration, "_check_elasticsearch_health", elasticsearch_check
+        ):
+            results = await asyncio.gather(
+                *(monitoring_integration.get_system_health() for _ in range(5))
+            )
+            await monitoring_integration.get_system_health()
+
+        assert all(r["prometheus"]["status"] == "healthy" for r in results)
+        prometheus_check.assert_awaited_once()
+        elasticsearch_check.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_system_health_isolates_failing_probe(self, monitoring_integration):
+        """Test one raising health probe does not hide the other backend"""
+        prometheus_check = AsyncMock(side_effect=RuntimeError("boom"))
+        elasticsearch_check = AsyncMock(return_value={"status": "green"})
+
+        with patch.object(
+            MonitoringIntegration, "_check_prometheus_health", prometheus_check
+        ), patch.object(
+            MonitoringIntegration, "_check_elasticsearch_health", elasticsearch_check
+        ):
+            health = await monitoring_integration.get_system_health()
+
+        assert health["prometheus"]["status"] == "unhealthy"
+        assert "boom" in health["prometheus"]["error"]
+        assert health["elasticsearch"] == {"status": "green"}
+
     @pytest.mark.asyncio
     async def test_create_alert(self, monitoring_integration):
         """Test creating monitoring alerts"""
@@ -124,13 +185,34 @@ class TestMonitoringIntegration:
         # Verify alert was sent to Elasticsearch
         monitoring_integration.session.post.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_requests_without_open_session_are_handled(self):
+        """Test probes and alerts report, not raise, when there is no session"""
+        integration = MonitoringIntegration()
+
+        # connect() was never called
+        assert (await integration._check_prometheus_health())["status"] == "unhealthy"
+        assert (await integration._check_elasticsearch_health())[
+            "status"
+        ] == "unhealthy"
+        await integration.create_alert("test_alert", "No session", "critical")
+
+        # The session was closed by disconnect()
+        integration.session = MagicMock()
+        integration.session.get.side_effect = RuntimeError("Session is closed")
+        integration.session.post.side_effect = RuntimeError("Session is closed")
+
+        health = await integration._check_prometheus_health()
+        assert health == {"status": "unhealthy", "error": "Session is closed"}
+        health = await integration._check_elasticsearch_health()
+        assert health == {"status": "unhealthy", "error": "Session is closed"}
+        await integration.create_alert("test_alert", "Closed session", "critical")
+
     @pytest.mark.asyncio
     async def test_check_prometheus_health_success(self, monitoring_integration):
         """Test Prometheus health check success"""
         # Mock successful response
-        monitoring_integration.session.get.return_value.__aenter__.return_value.status = (
-            200
-        )
+        monitoring_integration.session.get.return_value.status = 200
 
         health = await monitoring_integration._check_prometheus_health()
 
@@ -141,9 +223,7 @@ class TestMonitoringIntegration:
     async def test_check_prometheus_health_failure(self, monitoring_integration):
         """Test Prometheus health check failure"""
         # Mock failed response
-        monitoring_integration.session.get.return_value.__aenter__.return_value.status = (
-            500
-        )
+        monitoring_integration.session.get.return_value.status = 500
 
         health = await monitoring_integration._check_prometheus_health()
 
@@ -153,32 +233,29 @@ class TestMonitoringIntegration:
     @pytest.mark.asyncio
     async def test_check_elasticsearch_health_success(self, monitoring_integration):
         """Test Elasticsearch health check success"""
-        # Mock successful response with cluster data
-        mock_response = (
-            monitoring_integration.session.get.return_value.__aenter__.return_value
-        )
-        mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value={
-                "status": "green",
-                "cluster_name": "test-cluster",
-                "number_of_nodes": 3,
-            }
+        # Mock successful response with the filtered cluster data
+        mock_response = MagicMock(status=200)
+        mock_response.read = AsyncMock(
+            return_value=b'{"status":"green","cluster_name":"test-cluster",'
+            b'"number_of_nodes":3}'
         )
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        monitoring_integration.session.get = MagicMock(return_value=mock_response)
 
         health = await monitoring_integration._check_elasticsearch_health()
 
         assert health["status"] == "green"
         assert health["cluster_name"] == "test-cluster"
         assert health["number_of_nodes"] == 3
+        url = monitoring_integration.session.get.call_args[0][0]
+        assert "filter_path=status,cluster_name,number_of_nodes" in url
 
     @pytest.mark.asyncio
     async def test_check_elasticsearch_health_failure(self, monitoring_integration):
         """Test Elasticsearch health check failure"""
         # Mock failed response
-        monitoring_integration.session.get.return_value.__aenter__.return_value.status = (
-            503
-        )
+        monitoring_integration.session.get.return_value.status = 503
 
         health = await monitoring_integration._check_elasticsearch_health()
 
@@ -195,19 +272,19 @@ class TestMonitoringIntegration:
         }
 
         # Mock successful response
-        monitoring_integration.session.post.return_value.__aenter__.return_value.status = (
-            201
-        )
+        monitoring_integration.session.post.return_value.status = 201
 
         await monitoring_integration._send_to_elasticsearch(test_data)
+        await monitoring_integration.flush()
 
         # Verify POST request was made
         monitoring_integration.session.post.assert_called()
 
         # Verify correct URL and headers
         call_args = monitoring_integration.session.post.call_args
-        assert "aar-metrics/_doc" in call_args[1]["url"]
-        assert call_args[1]["headers"]["Content-Type"] == "application/json"
+        assert call_args[1]["url"].endswith("/_bulk")
+        assert call_args[1]["headers"]["Content-Type"] == "application/x-ndjson"
+        assert b'"_index":"aar-metrics"' in call_args[1]["data"]
 
     @pytest.mark.asyncio
     async def test_send_to_elasticsearch_failure(self, monitoring_integration):
@@ -215,36 +292,37 @@ class TestMonitoringIntegration:
         test_data = {"test": "data"}
 
         # Mock failed response
-        monitoring_integration.session.post.return_value.__aenter__.return_value.status = (
-            400
-        )
+        monitoring_integration.session.post.return_value.status = 400
 
         # Should not raise exception, just log error
         await monitoring_integration._send_to_elasticsearch(test_data)
+        await monitoring_integration.flush()
 
         monitoring_integration.session.post.assert_called()
 
     @pytest.mark.asyncio
     async def test_send_to_prometheus(self, monitoring_integration):
-        """Test sending metrics to Prometheus (currently logs)"""
-        test_metrics = {
-            "aar_id": "TEST-001",
-            "processing_duration": 2.5,
-            "compliance_score": 95.0,
-        }
+        """Test recording metrics in the Prometheus client registry"""
+        from src.monitoring_integration import AARMetric, aar_compliance_score
+
+        test_metrics = AARMetric(
+            aar_id="TEST-001",
+            compliance_score=95.0,
+            processing_duration=2.5,
+            timestamp="2024-01-01T00:00:00+00:00",
+        )
 
-        # Should complete without error (currently just logs)
+        sum_before = aar_compliance_score._sum.get()
         await monitoring_integration._send_to_prometheus(test_metrics)
 
-        # No assertions needed as this currently just logs
+        # Compliance score is observed in the Prometheus histogram
+        assert aar_compliance_score._sum.get() - sum_before == 95.0
 
     @pytest.mark.asyncio
     async def test_test_prometheus_connection_success(self, monitoring_integration):
         """Test Prometheus connection test success"""
         # Mock successful response
-        monitoring_integration.session.get.return_value.__aenter__.return_value.status = (
-            200
-        )
+        monitoring_integration.session.get.return_value.status = 200
 
         # Should not raise exception
         await monitoring_integration._test_prometheus_connection()
@@ -255,9 +333,7 @@ class TestMonitoringIntegration:
     async def test_test_prometheus_connection_failure(self, monitoring_integration):
         """Test Prometheus connection test failure"""
         # Mock failed response
-        monitoring_integration.session.get.return_value.__aenter__.return_value.status = (
-            404
-        )
+        monitoring_integration.session.get.return_value.status = 404
 
         # Should log warning but not raise exception
         await monitoring_integration._test_prometheus_connection()
@@ -268,9 +344,7 @@ class TestMonitoringIntegration:
     async def test_test_elasticsearch_connection_success(self, monitoring_integration):
         """Test Elasticsearch connection test success"""
         # Mock successful response
-        monitoring_integration.session.get.return_value.__aenter__.return_value.status = (
-            200
-        )
+        monitoring_integration.session.get.return_value.status = 200
 
         # Should not raise exception
         await monitoring_integration._test_elasticsearch_connection()
@@ -281,9 +355,7 @@ class TestMonitoringIntegration:
     async def test_test_elasticsearch_connection_failure(self, monitoring_integration):
         """Test Elasticsearch connection test failure"""
         # Mock failed response
-        monitoring_integration.session.get.return_value.__aenter__.return_value.status = (
-            503
-        )
+        monitoring_integration.session.get.return_value.status = 503
 
         # Should log warning but not raise exception
         await monitoring_integration._test_elasticsearch_connection()
@@ -298,6 +370,7 @@ class TestMonitoringIntegration:
 
         # Should not raise exception, just log error
         await monitoring_integration.send_aar_metrics("TEST-001", 95.0, 2.5)
+        await monitoring_integration.flush()
 
         monitoring_integration.session.post.assert_called()
 
@@ -312,6 +385,44 @@ class TestMonitoringIntegration:
         assert "error" in health_data
         assert "Connection error" in health_data["error"]
 
+    def test_now_iso_is_utc_and_reused_within_a_second(self):
+        """Test emit timestamps are UTC ISO strings cached per second"""
+        from src.monitoring_integration import _now_iso
+
+        with patch("src.monitoring_integration.time.time", return_value=1700000000.2):
+            first = _now_iso()
+        with patch("src.monitoring_integration.time.time", return_value=1700000000.9):
+            second = _now_iso()
+        with patch("src.monitoring_integration.time.time", return_value=1700000001.0):
+            third = _now_iso()
+
+        assert first is second
+        assert first == "2023-11-14T22:13:20+00:00"
+        assert third == "2023-11-14T22:13:21+00:00"
+        assert datetime.fromisoformat(third).utcoffset().total_seconds() == 0
+
+    @pytest.mark.asyncio
+    async def test_get_monitoring_returns_one_shared_instance(self):
+        """Test concurrent get_monitoring calls share one connected instance"""
+        from src.monitoring_integration import close_monitoring, get_monitoring
+
+        with patch.object(
+            MonitoringIntegration, "connect", AsyncMock()
+        ) as connect, patch.object(MonitoringIntegration, "disconnect", AsyncMock()):
+            first, second = await asyncio.gather(get_monitoring(), get_monitoring())
+            assert first is second
+            connect.assert_awaited_once()
+
+            await close_monitoring()
+            assert await get_monitoring() is not first
+            await close_monitoring()
+
+    def test_instances_have_no_attribute_dict(self):
+        """Test MonitoringIntegration uses __slots__ instead of a per-instance dict"""
+        integration = MonitoringIntegration()
+
+        assert not hasattr(integration, "__dict__")
+
     def test_get_sacred_geometry_context(self):
         """Test Sacred Geometry context retrieval"""
         context = get_sacred_geometry_context()
@@ -343,8 +454,6 @@ class TestMonitoringIntegration:
     @pytest.mark.asyncio
     async def test_concurrent_monitoring_operations(self, monitoring_integration):
         """Test concurrent monitoring operations"""
-        import asyncio
-
         # Create multiple concurrent operations
         tasks = []
         for i in range(5):
@@ -360,6 +469,110 @@ class TestMonitoringIntegration:
         for result in results:
             assert not isinstance(result, Exception)
 
+    @pytest.mark.asyncio
+    async def test_metrics_are_batched_into_one_bulk_request(
+        self, monitoring_integration
+    ):
+        """Test metrics queued together are sent in a single _bulk request"""
+        for i in range(5):
+            await monitoring_integration.send_aar_metrics(f"TEST-{i}", 90.0, 2.0)
+        await monitoring_integration.flush()
+
+        assert monitoring_integration.session.post.call_count == 1
+        body = monitoring_integration.session.post.call_args[1]["data"]
+        assert body.count(b'"_index":"aar-metrics"') == 5
+
+    @pytest.mark.asyncio
+    async def test_large_bulk_requests_are_gzipped(self, monitoring_integration):
+        """Test _bulk bodies above the threshold are sent gzip-encoded"""
+        import gzip
+
+        for i in range(50):
+            await monitoring_integration.send_aar_metrics(f"TEST-{i}", 90.0, 2.0)
+        await monitoring_integration.flush()
+
+        call_kwargs = monitoring_integration.session.post.call_args[1]
+        assert call_kwargs["headers"]["Content-Encoding"] == "gzip"
+        body = gzip.decompress(call_kwargs["data"])
+        assert body.count(b'"_index":"aar-metrics"') == 50
+        assert len(call_kwargs["data"]) < len(body)
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_dropped_when_queue_is_full(self, monitoring_integration):
+        """Test a full metrics queue sheds documents instead of blocking"""
+        from src import monitoring_integration as module
+
+        with patch.object(module, "_BULK_QUEUE_MAXSIZE", 2):
+            dropped_before = module.metrics_dropped_total._value.get()
+            for i in range(5):
+                await monitoring_integration.send_aar_metrics(f"TEST-{i}", 90.0, 2.0)
+
+            assert module.metrics_dropped_total._value.get() - dropped_before == 3
+            await monitoring_integration.flush()
+
+    @pytest.mark.asyncio
+    async def test_rejected_bulk_requests_count_as_dropped(
+        self, monitoring_integration
+    ):
+        """Test a 4xx or unreadable _bulk response counts the batch as dropped"""
+        import orjson
+
+        from src import monitoring_integration as module
+
+        rejected = MagicMock(status=400)
+        rejected.__aenter__ = AsyncMock(return_value=rejected)
+        rejected.__aexit__ = AsyncMock(return_value=None)
+        garbled = MagicMock(status=200)
+        garbled.json = AsyncMock(side_effect=orjson.JSONDecodeError("bad", "", 0))
+        garbled.__aenter__ = AsyncMock(return_value=garbled)
+        garbled.__aexit__ = AsyncMock(return_value=None)
+
+        for response in (rejected, garbled):
+            monitoring_integration.session.post = MagicMock(return_value=response)
+            dropped_before = module.metrics_dropped_total._value.get()
+            for i in range(3):
+                await monitoring_integration._send_to_elasticsearch({"n": i})
+            await monitoring_integration.flush()
+
+            # Elasticsearch answered: no retry, no breaker failure
+            assert monitoring_integration.session.post.call_count == 1
+            assert module.metrics_dropped_total._value.get() - dropped_before == 3
+            assert monitoring_integration._breaker["fails"] == 0
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_opens_after_repeated_server_errors(
+        self, monitoring_integration
+    ):
+        """Test repeated 5xx responses trip the breaker and shed new documents"""
+        from src import monitoring_integration as module
+
+        response = MagicMock(status=503)
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        monitoring_integration.session.post = MagicMock(return_value=response)
+
+        with patch.object(module, "_BULK_RETRY_JITTER", 0):
+            for i in range(module._BREAKER_FAILURE_THRESHOLD):
+                await monitoring_integration._send_to_elasticsearch({"n": i})
+                await monitoring_integration.flush()
+
+        # Every batch is retried once before counting as a failure
+        assert (
+            monitoring_integration.session.post.call_count
+            == 2 * module._BREAKER_FAILURE_THRESHOLD
+        )
+        assert monitoring_integration._breaker_open()
+
+        dropped_before = module.metrics_dropped_total._value.get()
+        await monitoring_integration._send_to_elasticsearch({"n": "late"})
+        await monitoring_integration.flush()
+
+        assert module.metrics_dropped_total._value.get() - dropped_before == 1
+        assert (
+            monitoring_integration.session.post.call_count
+            == 2 * module._BREAKER_FAILURE_THRESHOLD
+        )
+
     @pytest.mark.asyncio
     async def test_alert_creation_with_different_severities(
         self, monitoring_integration
@@ -374,8 +587,20 @@ class TestMonitoringIntegration:
                 severity=severity,
             )
 
-        # Verify correct number of POST calls made
-        assert monitoring_integration.session.post.call_count == len(severities)
+        # "info" is below the default warning floor and is never sent
+        assert monitoring_integration.session.post.call_count == len(severities) - 1
+
+    @pytest.mark.asyncio
+    async def test_alert_severity_floor_is_configurable(self, mock_aiohttp_session):
+        """Test AAR_ALERT_MIN lowers or raises the persisted severity floor"""
+        with patch.dict("os.environ", {"AAR_ALERT_MIN": "info"}):
+            integration = MonitoringIntegration()
+        integration.session = mock_aiohttp_session
+
+        await integration.create_alert("test_alert", "Test debug alert", "debug")
+        await integration.create_alert("test_alert", "Test info alert", "info")
+
+        assert mock_aiohttp_session.post.call_count == 1
 
     @pytest.mark.asyncio
     async def test_metrics_data_structure(self, monitoring_integration):
@@ -383,14 +608,21 @@ class TestMonitoringIntegration:
         # Capture the data sent to monitoring systems
         sent_data = []
 
-        async def capture_post(*args, **kwargs):
-            if "json" in kwargs:
-                sent_data.append(kwargs["json"])
-            return monitoring_integration.session.post.return_value
+        response = MagicMock(status=200)
+        response.json = AsyncMock(return_value={"errors": False})
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+
+        def capture_post(*args, **kwargs):
+            # Metrics go out as NDJSON _bulk: action line, then the document
+            lines = kwargs["data"].splitlines()
+            sent_data.extend(json.loads(line) for line in lines[1::2])
+            return response
 
-        monitoring_integration.session.post = AsyncMock(side_effect=capture_post)
+        monitoring_integration.session.post = MagicMock(side_effect=capture_post)
 
         await monitoring_integration.send_aar_metrics("TEST-001", 95.5, 3.2)
+        await monitoring_integration.flush()
 
         # Verify data structure
         assert len(sent_data) >= 1
@@ -3,6 +3,7 @@
 Tests that match the actual MonitoringIntegration API
 """
 
+import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -55,6 +56,27 @@ class TestMonitoringIntegrationFixed:
             assert integration.connected is True
             assert integration.session is not None
 
+    @pytest.mark.asyncio
+    async def test_connect_uses_pooled_connector(self):
+        """Test connect builds one pooled keep-alive connector for the session"""
+        with patch(
+            "src.monitoring_integration.aiohttp.TCPConnector"
+        ) as mock_connector_class, patch(
+            "src.monitoring_integration.aiohttp.ClientSession"
+        ) as mock_session_class:
+            mock_session_class.return_value = MagicMock()
+
+            integration = MonitoringIntegration()
+            await integration.connect()
+
+            connector_kwargs = mock_connector_class.call_args.kwargs
+            assert connector_kwargs["limit_per_host"] == 16
+            assert connector_kwargs["ttl_dns_cache"] == 300
+            assert connector_kwargs["use_dns_cache"] is True
+            assert connector_kwargs["family"] == socket.AF_INET
+            session_kwargs = mock_session_class.call_args.kwargs
+            assert session_kwargs["connector"] is mock_connector_class.return_value
+
     @pytest.mark.asyncio
     async def test_connect_failure(self):
         """Test connection failure handling"""
@@ -100,14 +122,18 @@ class TestMonitoringIntegrationFixed:
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
         mock_session.post = AsyncMock(return_value=mock_response)
+        mock_session.close = AsyncMock()
         integration.session = mock_session
         integration.connected = True
 
         await integration.send_aar_metrics("test-aar-123", 0.95, 2.5)
+        await integration.flush()
 
         # Verify metrics were sent
         assert mock_session.post.called
 
+        await integration.disconnect()
+
     @pytest.mark.asyncio
     async def test_get_system_health(self):
         """Test getting system health status"""
@@ -4,6 +4,7 @@ Tests that match the actual SacredGeometryEngine API signatures
 """
 
 import asyncio
+import warnings
 
 from src.sacred_geometry_engine import SacredGeometryEngine
 
@@ -236,6 +237,261 @@ class TestSacredGeometryEngineCorrect:
         assert isinstance(aar_id, str)
         assert len(aar_id) > 0
 
+    async def test_validate_data_serializes_data_once(self):
+        """Test all pattern helpers share one JSON serialization of the data"""
+        from unittest.mock import patch
+
+        import orjson
+
+        engine = SacredGeometryEngine()
+        data = {
+            "mission_id": "MISSION-001",
+            "mission_type": "analysis",
+            "context_data": {"phase": "iteration", "error": "handled", "steps": 5},
+        }
+
+        with patch(
+            "src.sacred_geometry_engine.orjson.dumps", wraps=orjson.dumps
+        ) as dumps:
+            result = await engine.validate_data(data)
+
+        assert dumps.call_count == 1
+        spiral = engine.patterns["spiral"](data)
+        assert result["pattern_results"]["spiral"]["score"] == spiral["score"]
+
+    def test_keyword_scan_matches_substring_search(self):
+        """Test the single-pass keyword scan finds overlapping keywords"""
+        from src.sacred_geometry_engine import _ALL_INDICATORS, _scan_keywords
+
+        # "handlevel" overlaps handle/level; "contextscope" abuts two fields
+        for text in ["handlevel", "re-iterations", "contextscope", "", "no match"]:
+            expected = {k for k in _ALL_INDICATORS if k in text}
+            assert _scan_keywords(text) == expected
+
+    async def test_validate_data_isolates_failing_pattern(self):
+        """Test one raising pattern is reported without losing the others"""
+        from unittest.mock import MagicMock
+
+        engine = SacredGeometryEngine()
+        engine.patterns["circle"] = MagicMock(side_effect=ValueError("broken"))
+
+        result = await engine.validate_data({"mission_id": "MISSION-001"})
+
+        assert result["pattern_results"]["circle"] == {
+            "valid": False,
+            "score": 0.0,
+            "error": "broken",
+        }
+        assert result["total_patterns"] == 5
+        assert "error" not in result["pattern_results"]["fractal"]
+
+    def test_extract_numbers_returns_array_in_traversal_order(self):
+        """Test numbers from values and strings come back as one float array"""
+        engine = SacredGeometryEngine()
+
+        numbers = engine._extract_numbers_from_data(
+            {"a": 3, "b": "step 5 of 8.5", "c": [1.618, {"d": -2}]}
+        )
+
+        assert numbers.dtype.name == "float64"
+        assert numbers.tolist() == [3.0, 5.0, 8.5, 1.618, -2.0]
+
+    def test_single_tree_walk_matches_recursive_helpers(self):
+        """Test the shared tree walk agrees with the recursive walkers"""
+        from src.sacred_geometry_engine import _walk_tree
+
+        engine = SacredGeometryEngine()
+        data = {"a": {"b": [1, {"a": 2}], "c": {}}, "d": [[], "x"]}
+
+        tree = _walk_tree(data)
+
+        level_counts = {}
+        engine._count_nesting_levels(data, level_counts, 0)
+        patterns = {}
+        engine._analyze_structure_patterns(data, patterns, 0)
+        assert tree["level_counts"] == [
+            level_counts[lvl] for lvl in sorted(level_counts)
+        ]
+        assert sorted(tree["structure_patterns"].values()) == sorted(patterns.values())
+        assert (
+            tree["structure_patterns"][(False, 0, 2)] == patterns["dict_level_0_keys_2"]
+        )
+        assert (
+            tree["structure_patterns"][(True, 2, 2)] == patterns["list_level_2_items_2"]
+        )
+        assert tree["max_depth"] == engine._calculate_max_depth(data)
+        assert tree["recursive_hits"] == 1
+
+    async def test_fibonacci_alignment_uses_precomputed_set(self):
+        """Test Fibonacci membership is precomputed and truncates like int()"""
+        engine = SacredGeometryEngine()
+        await engine._initialize_patterns()
+
+        assert 6765 in engine.fibonacci_set
+        # 8.9 -> 8 and 21 match, 4 does not
+        score = engine._check_fibonacci_alignment({"values": [8.9, 21, 4]})
+        assert abs(score - 2 / 3) < 1e-9
+
+        # Non-finite and out-of-int64-range values are misses, not warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            score = engine._check_fibonacci_alignment(
+                {"values": [13, float("nan"), float("inf"), -float("inf"), 2.0**64]}
+            )
+        assert abs(score - 1 / 5) < 1e-9
+
+    def test_generate_aar_id_format(self):
+        """Test AAR IDs keep the aar_ prefix and 39 hex characters"""
+        import re
+
+        engine = SacredGeometryEngine()
+
+        aar_id = engine.generate_aar_id("MISSION-001")
+
+        assert re.fullmatch(r"aar_[0-9a-f]{39}", aar_id)
+
+    def test_structure_balance_entropy(self):
+        """Test structure balance is a normalized entropy over value types"""
+        engine = SacredGeometryEngine()
+
+        assert engine._calculate_structure_balance({}) == 0.0
+        assert engine._calculate_structure_balance({"a": 1, "b": 2}) == 1.0
+
+        balanced = {"a": 1, "b": 1.5, "c": "x", "d": None}
+        assert engine._calculate_structure_balance(balanced) == 1.0
+
+        skewed = engine._calculate_structure_balance({"a": 1, "b": 2, "c": "x"})
+        assert isinstance(skewed, float)
+        assert 0.9 < skewed < 0.92
+
+    def test_circular_completeness_ignores_self_reference(self):
+        """Test circular completeness only counts references to other keys"""
+        engine = SacredGeometryEngine()
+
+        data = {
+            "Summary": {"see": "details"},
+            "details": ["summary only"],
+            "notes": {"notes": "self reference"},
+            "plain": "details",
+        }
+
+        # Summary -> details and details -> summary count; notes and plain don't
+        assert engine._calculate_circular_completeness(data) == 0.5
+
+    def test_tree_walk_recursive_keys_follow_path(self):
+        """Test recursive keys are only counted against their own ancestors"""
+        from src.sacred_geometry_engine import _walk_tree
+
+        nested = {"a": {"b": {"a": {"a": 1}}}}
+        assert _walk_tree(nested)["recursive_hits"] == 2
+
+        # Keys in sibling branches and list items don't count as recursion
+        siblings = {"x": {"y": 1}, "y": [{"x": 2}], "z": [{"z": 3}]}
+        assert _walk_tree(siblings)["recursive_hits"] == 1
+
+    def test_extract_numbers_handles_deep_nesting(self):
+        """Test number extraction does not recurse per nesting level"""
+        engine = SacredGeometryEngine()
+
+        data = {"value": 1}
+        for _ in range(5000):
+            data = {"nested": [data, 2]}
+
+        numbers = engine._extract_numbers_from_data(data)
+
+        assert numbers.size == 5001
+        assert numbers[-1] == 2.0
+        assert numbers[0] == 1.0
+
+    async def test_validate_data_reuses_cached_result(self):
+        """Test repeat payloads are answered without rerunning the patterns"""
+        from unittest.mock import MagicMock
+
+        engine = SacredGeometryEngine()
+        fractal = MagicMock(return_value={"valid": True, "score": 1.0})
+        engine.patterns["fractal"] = fractal
+        data = {"mission_id": "MISSION-001", "step": [1, 2, 3]}
+
+        first = await engine.validate_data(data)
+        first["pattern_results"]["fractal"]["score"] = -1.0
+        second = await engine.validate_data(dict(data))
+
+        assert fractal.call_count == 1
+        assert second["pattern_results"]["fractal"]["score"] == 1.0
+        assert second["overall_compliance"] == first["overall_compliance"]
+
+        # Key order is part of the fingerprint, as the scores depend on it
+        await engine.validate_data({"step": [1, 2, 3], "mission_id": "MISSION-001"})
+        assert fractal.call_count == 2
+
+    async def test_validate_data_cache_tracks_pattern_table(self):
+        """Test replacing a pattern entry bypasses results cached before it"""
+        from unittest.mock import MagicMock
+
+        engine = SacredGeometryEngine()
+        data = {"mission_id": "MISSION-001", "step": [1, 2, 3]}
+        await engine.validate_data(data)
+
+        engine.patterns["circle"] = MagicMock(side_effect=ValueError("boom"))
+        result = await engine.validate_data(data)
+
+        assert result["pattern_results"]["circle"] == {
+            "valid": False,
+            "score": 0.0,
+            "error": "boom",
+        }
+
+    async def test_validate_data_skips_cache_for_non_json_payloads(self):
+        """Test tuples are not cached under their list twin's fingerprint"""
+        as_tuples = {"x": ((1, 2), (3, 4)), "y": {"x": 1}}
+        as_lists = {"x": [[1, 2], [3, 4]], "y": {"x": 1}}
+
+        expected = await SacredGeometryEngine().validate_data(as_tuples)
+
+        engine = SacredGeometryEngine()
+        await engine.validate_data(as_lists)
+        result = await engine.validate_data(as_tuples)
+
+        assert result["overall_compliance"] == expected["overall_compliance"]
+
+    def test_scan_context_json_falls_back_for_wide_ints(self):
+        """Test values orjson rejects still serialize through the stdlib"""
+        from src.sacred_geometry_engine import _ScanContext
+
+        engine = SacredGeometryEngine()
+
+        scan = _ScanContext(engine, {"Phase": 2**70, 1: "Error"})
+
+        assert scan.json_bytes == b'{"Phase":1180591620717411303424,"1":"Error"}'
+        assert scan.keyword_hits == {"phase", "error"}
+        assert scan.fingerprint is not None
+
+    def test_generate_aar_id_uses_supplied_timestamp(self):
+        """Test a caller-supplied timestamp makes the AAR ID reproducible"""
+        engine = SacredGeometryEngine()
+        now_iso = "2024-01-01T00:00:00"
+
+        first = engine.generate_aar_id("MISSION-001", now_iso=now_iso)
+
+        assert first == engine.generate_aar_id("MISSION-001", now_iso=now_iso)
+        assert first != engine.generate_aar_id("MISSION-002", now_iso=now_iso)
+
+    def test_key_helpers_share_lowered_keys(self):
+        """Test key-based helpers read the scan context's lowered keys"""
+        engine = SacredGeometryEngine()
+        data = {"Version": 1, "Created_At": "now", "Meta": {}, "Body": "x"}
+        scan = engine._prepare_scan_context(data)
+
+        assert scan.lowered_keys == ("version", "created_at", "meta", "body")
+
+        # Helpers given the context use its keys instead of lowering again
+        scan.__dict__["lowered_keys"] = ("a", "b", "c", "d")
+        assert engine._evaluate_enhancement_progression(data, scan) == 0.0
+        assert engine._evaluate_enhancement_progression(data) == 0.5
+        assert engine._evaluate_api_design_proportions(
+            data, scan
+        ) != engine._evaluate_api_design_proportions(data)
+
 
 def run_sync_tests():
     """Run synchronous tests"""
@@ -263,6 +519,44 @@ def run_sync_tests():
         ("test_generate_multiple_aar_ids", test.test_generate_multiple_aar_ids),
         ("test_private_pattern_methods_exist", test.test_private_pattern_methods_exist),
         ("test_analysis_methods_exist", test.test_analysis_methods_exist),
+        (
+            "test_keyword_scan_matches_substring_search",
+            test.test_keyword_scan_matches_substring_search,
+        ),
+        (
+            "test_extract_numbers_returns_array_in_traversal_order",
+            test.test_extract_numbers_returns_array_in_traversal_order,
+        ),
+        (
+            "test_single_tree_walk_matches_recursive_helpers",
+            test.test_single_tree_walk_matches_recursive_helpers,
+        ),
+        ("test_generate_aar_id_format", test.test_generate_aar_id_format),
+        (
+            "test_generate_aar_id_uses_supplied_timestamp",
+            test.test_generate_aar_id_uses_supplied_timestamp,
+        ),
+        ("test_structure_balance_entropy", test.test_structure_balance_entropy),
+        (
+            "test_circular_completeness_ignores_self_reference",
+            test.test_circular_completeness_ignores_self_reference,
+        ),
+        (
+            "test_tree_walk_recursive_keys_follow_path",
+            test.test_tree_walk_recursive_keys_follow_path,
+        ),
+        (
+            "test_extract_numbers_handles_deep_nesting",
+            test.test_extract_numbers_handles_deep_nesting,
+        ),
+        (
+            "test_scan_context_json_falls_back_for_wide_ints",
+            test.test_scan_context_json_falls_back_for_wide_ints,
+        ),
+        (
+            "test_key_helpers_share_lowered_keys",
+            test.test_key_helpers_share_lowered_keys,
+        ),
     ]
 
     passed = 0
@@ -304,6 +598,30 @@ async def run_async_tests():
             "test_initialization_and_health_flow",
             test.test_initialization_and_health_flow,
         ),
+        (
+            "test_validate_data_serializes_data_once",
+            test.test_validate_data_serializes_data_once,
+        ),
+        (
+            "test_validate_data_isolates_failing_pattern",
+            test.test_validate_data_isolates_failing_pattern,
+        ),
+        (
+            "test_fibonacci_alignment_uses_precomputed_set",
+            test.test_fibonacci_alignment_uses_precomputed_set,
+        ),
+        (
+            "test_validate_data_reuses_cached_result",
+            test.test_validate_data_reuses_cached_result,
+        ),
+        (
+            "test_validate_data_cache_tracks_pattern_table",
+            test.test_validate_data_cache_tracks_pattern_table,
+        ),
+        (
+            "test_validate_data_skips_cache_for_non_json_payloads",
+            test.test_validate_data_skips_cache_for_non_json_payloads,
+        ),
     ]
 
     passed = 0